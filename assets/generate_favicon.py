@@ -4,13 +4,145 @@ Generate favicon files from the Code Guro logo.
 Removes text and centers the icon.
 """
 
-import os
-
+import io
+import shutil
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+import numpy as np
 from PIL import Image
 
+try:
+    from cykooz.resizer import FilterType, ImageData, PixelType, ResizeAlg, Resizer
+except ImportError:  # Optional SIMD backend; fall back to Pillow's Lanczos
+    Resizer = None
+
+try:
+    import oxipng
+except ImportError:  # Optional Zopfli-class PNG recompressor (pyoxipng)
+    oxipng = None
+
+# Reuse a single Resizer: the configured algorithm and its filter
+# coefficient tables are cached on the instance across resize calls
+_resizer = Resizer(ResizeAlg.convolution(FilterType.lanczos3)) if Resizer else None
+
+
+def resize_lanczos(img: Image.Image, target_w: int, target_h: int) -> Image.Image:
+    """Lanczos3 resize using cykooz.resizer's SIMD backend when available.
+
+    The Rust backend dispatches to SSE4.1/AVX2/NEON kernels for RGBA
+    convolution, which is much faster than Pillow's scalar implementation.
+    Falls back to Pillow if cykooz.resizer is not installed.
+    """
+    if _resizer is None:
+        return img.resize((target_w, target_h), Image.Resampling.LANCZOS)
+
+    width, height = img.size
+    src = ImageData(width, height, PixelType.U8x4, bytes(img.tobytes()))
+    dst = ImageData(target_w, target_h, PixelType.U8x4)
+    _resizer.resize(src, dst)
+    return Image.frombytes("RGBA", (target_w, target_h), bytes(dst.get_buffer()))
+
+
 # Paths
-INPUT_LOGO = "/Users/nicoladevera/Developer/code-guro/assets/logo-code-guro-dark-small.png"
-OUTPUT_DIR = "/Users/nicoladevera/Developer/code-guro/assets"
+INPUT_LOGO = Path("/Users/nicoladevera/Developer/code-guro/assets/logo-code-guro-dark-small.png")
+OUTPUT_DIR = Path("/Users/nicoladevera/Developer/code-guro/assets")
+
+
+def save_png(img: Image.Image, path: Path, try_palette: bool = False) -> None:
+    """Save a PNG with Pillow's optimize pass, optionally trying a palette.
+
+    optimize=True runs Pillow's filter/zlib-9 search for smaller output.
+    For the small favicon sizes a 256-color palette often wins, so when
+    try_palette is set both encodings are produced in memory and the
+    smaller one is written. When pyoxipng is installed the winning bytes
+    are recompressed in-process for Zopfli-quality deflate without the
+    fork/exec cost of an external optimizer; Pillow's own optimize pass
+    is skipped in that case since oxipng redoes the compression anyway.
+    """
+    buf = io.BytesIO()
+    img.save(buf, "PNG", optimize=oxipng is None)
+    data = buf.getvalue()
+
+    if try_palette:
+        try:
+            quantized = img.quantize(colors=256, method=Image.Quantize.LIBIMAGEQUANT)
+        except ValueError:
+            # libimagequant not compiled into this Pillow build
+            quantized = img.quantize(colors=256)
+        palette_buf = io.BytesIO()
+        quantized.save(palette_buf, "PNG", optimize=oxipng is None)
+        if len(palette_buf.getvalue()) < len(data):
+            data = palette_buf.getvalue()
+
+    if oxipng is not None:
+        data = oxipng.optimize_from_memory(data, level=4)
+
+    path.write_bytes(data)
+
+
+def build_ico(frames: List[Image.Image]) -> bytes:
+    """Assemble a multi-size ICO container directly with struct.
+
+    Frames up to 32x32 are stored as raw 32-bit BGRA DIBs (bottom-up,
+    with an all-zero AND mask — the alpha channel carries transparency),
+    skipping the PNG codec entirely. Larger frames are embedded as PNG
+    streams, which compress better at those sizes.
+    """
+    header = struct.pack("<HHH", 0, 1, len(frames))
+    entries = []
+    blobs = []
+    offset = len(header) + 16 * len(frames)
+
+    for frame in frames:
+        frame_w, frame_h = frame.size
+        if frame_w <= 32 and frame_h <= 32:
+            # BITMAPINFOHEADER with doubled height to account for the
+            # AND mask; pixel rows are BGRA, bottom-up
+            bgra = np.asarray(frame)[::-1, :, [2, 1, 0, 3]]
+            mask_stride = ((frame_w + 31) // 32) * 4
+            blob = (
+                struct.pack(
+                    "<IiiHHIIiiII",
+                    40,
+                    frame_w,
+                    frame_h * 2,
+                    1,
+                    32,
+                    0,
+                    frame_w * frame_h * 4,
+                    0,
+                    0,
+                    0,
+                    0,
+                )
+                + bgra.tobytes()
+                + b"\x00" * (mask_stride * frame_h)
+            )
+        else:
+            png_buf = io.BytesIO()
+            frame.save(png_buf, "PNG", optimize=True)
+            blob = png_buf.getvalue()
+
+        entries.append(
+            struct.pack(
+                "<BBBBHHII",
+                frame_w if frame_w < 256 else 0,
+                frame_h if frame_h < 256 else 0,
+                0,  # no palette
+                0,  # reserved
+                1,  # color planes
+                32,  # bits per pixel
+                len(blob),
+                offset,
+            )
+        )
+        blobs.append(blob)
+        offset += len(blob)
+
+    return header + b"".join(entries) + b"".join(blobs)
 
 
 def create_favicon():
@@ -18,7 +150,14 @@ def create_favicon():
 
     # Load the original image
     print(f"Loading logo from: {INPUT_LOGO}")
-    img = Image.open(INPUT_LOGO)
+    # Lock the format so Pillow skips format sniffing, and drop the ICC
+    # profile before decode so no color transform is applied.
+    # Normalize to RGBA immediately so every downstream step works on a
+    # contiguous 4-byte-per-pixel buffer with no implicit conversions
+    # (convert() also forces the lazy PNG decode to happen once, here)
+    img = Image.open(INPUT_LOGO, formats=["PNG"])
+    img.info.pop("icc_profile", None)
+    img = img.convert("RGBA")
     print(f"Original size: {img.size}")
 
     # Get image dimensions
@@ -34,54 +173,69 @@ def create_favicon():
     # - Bottom of icon (before text): ~75px
     # - Left/right margins: ~10px each side
 
-    # Crop to the icon only (removing text and excess margins)
-    # Adjusted coordinates to properly center the icon vertically
-    crop_box = (10, 13, width - 10, 77)  # (left, top, right, bottom)
-    img_cropped = img.crop(crop_box)
-    print(f"Cropped size: {img_cropped.size}")
-
-    # Create a square canvas
-    # Use the larger dimension to make it square
-    square_size = max(img_cropped.size)
-
-    # Create a new square image with the same background color
-    # Extract the background color from a corner pixel
-    bg_color = img.getpixel((0, 0))
-    square_img = Image.new("RGBA", (square_size, square_size), bg_color)
-
-    # Calculate position to paste the cropped image (perfectly centered)
-    paste_x = (square_size - img_cropped.width) // 2
-    paste_y = (square_size - img_cropped.height) // 2
-
-    # Paste the cropped image onto the square canvas
-    square_img.paste(img_cropped, (paste_x, paste_y))
-    print(f"Square canvas size: {square_img.size}")
-
-    # Generate different favicon sizes
-    sizes = [16, 32, 48]
-    png_files = []
-
-    for size in sizes:
-        # Resize with high-quality resampling
-        resized = square_img.resize((size, size), Image.Resampling.LANCZOS)
-
-        # Save as PNG
-        output_file = os.path.join(OUTPUT_DIR, f"favicon-{size}x{size}.png")
-        resized.save(output_file, "PNG")
-        png_files.append(output_file)
-        print(f"✓ Created: favicon-{size}x{size}.png")
-
-    # Create a multi-size ICO file
-    ico_sizes = [(16, 16), (32, 32), (48, 48)]
-    ico_images = [square_img.resize(size, Image.Resampling.LANCZOS) for size in ico_sizes]
-
-    ico_file = os.path.join(OUTPUT_DIR, "favicon.ico")
-    ico_images[0].save(ico_file, format="ICO", sizes=ico_sizes)
+    # Crop to the icon only (removing text and excess margins), done as a
+    # NumPy slice on a single RGBA array instead of a PIL crop buffer.
+    # Adjusted coordinates to properly center the icon vertically:
+    # rows 13-77, columns 10..(width-10)
+    arr = np.asarray(img)
+    cropped = arr[13:77, 10 : width - 10]
+    crop_h, crop_w = cropped.shape[:2]
+    print(f"Cropped size: {crop_w}x{crop_h}")
+
+    # The icon sits centered on a conceptual square canvas whose side is
+    # the larger cropped dimension; only the scale is derived from it —
+    # the full-size canvas itself is never materialized. The background
+    # padding is filled directly at the target size, so the Lanczos
+    # kernel only runs over real icon pixels, not constant fill.
+    square_size = max(crop_h, crop_w)
+    bg_color = arr[0, 0]
+
+    scale = 48 / square_size
+    target_w = round(crop_w * scale)
+    target_h = round(crop_h * scale)
+    rect48 = resize_lanczos(Image.fromarray(cropped, "RGBA"), target_w, target_h)
+
+    canvas48 = np.full((48, 48, 4), bg_color, dtype=np.uint8)
+    offset_x = (48 - target_w) // 2
+    offset_y = (48 - target_h) // 2
+    canvas48[offset_y : offset_y + target_h, offset_x : offset_x + target_w] = np.asarray(rect48)
+    img48 = Image.fromarray(canvas48, "RGBA")
+
+    # Generate the smaller favicon sizes as a resize pyramid from 48.
+    # BOX is a single tap per output pixel and avoids Lanczos ringing,
+    # which is visible at favicon sizes (the "super sampling" strategy).
+    # 32->16 is an exact 2x factor, so reduce(2) takes Pillow's tight
+    # integer-box fast path instead of the general resampler.
+    img32 = img48.resize((32, 32), Image.Resampling.BOX)
+    img16 = img32.reduce(2)
+
+    # Precompute all output paths once, outside the save loop
+    png_paths = {size: OUTPUT_DIR / f"favicon-{size}x{size}.png" for size in (16, 32, 48)}
+    ico_file = OUTPUT_DIR / "favicon.ico"
+    favicon_png = OUTPUT_DIR / "favicon.png"
+
+    # Save each size as PNG, reusing the pyramid outputs directly.
+    # Dispatch the encodes concurrently: zlib compression runs with the
+    # GIL released, so the three saves overlap. A palette encode is
+    # worth trying at the small sizes.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            size: executor.submit(save_png, resized, png_paths[size], size <= 32)
+            for size, resized in ((16, img16), (32, img32), (48, img48))
+        }
+        for size, future in futures.items():
+            future.result()
+            print(f"✓ Created: favicon-{size}x{size}.png")
+
+    # Create a multi-size ICO file from the already-resized images,
+    # assembling the container directly instead of going through
+    # Pillow's ICO writer and its per-frame codec path
+    ico_file.write_bytes(build_ico([img16, img32, img48]))
     print("✓ Created: favicon.ico (contains 16x16, 32x32, 48x48)")
 
     # Also save a base favicon.png at 32x32 (common default)
-    favicon_png = os.path.join(OUTPUT_DIR, "favicon.png")
-    square_img.resize((32, 32), Image.Resampling.LANCZOS).save(favicon_png, "PNG")
+    # Copy the already-encoded 32x32 bytes instead of re-running the encoder
+    shutil.copyfile(png_paths[32], favicon_png)
     print("✓ Created: favicon.png (32x32)")
 
     print(f"\n✅ All favicons generated successfully in: {OUTPUT_DIR}")
@@ -0,0 +1,26 @@
+"""Console-script entry point that avoids importing Click for trivial flags."""
+
+import sys
+
+
+def entry_point() -> None:
+    """Dispatch to the Click CLI, short-circuiting informational flags.
+
+    Importing code_guro.cli pulls in Click, which dominates the CLI's
+    import time; --version needs none of it, so it is answered here
+    before that import happens.
+    """
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in ("-V", "--version"):
+        from code_guro import __version__
+
+        print(f"code-guro, version {__version__}")
+        return
+
+    from code_guro.cli import main
+
+    main()
+
+
+if __name__ == "__main__":
+    entry_point()
@@ -17,7 +17,7 @@ from rich.prompt import Confirm
 from code_guro.frameworks import FrameworkInfo, detect_frameworks
 from code_guro.utils import (
     SAFE_CONTEXT_TOKENS,
-    count_tokens,
+    count_tokens_batch,
     estimate_cost,
     format_cost,
     is_file_too_large,
@@ -31,7 +31,12 @@ console = Console()
 
 @dataclass
 class FileInfo:
-    """Information about a source file."""
+    """Information about a source file.
+
+    parts and top_dir are derived from relative_path once at
+    construction so hot loops never re-split the path; top_dir is ""
+    for root-level files.
+    """
 
     path: Path
     relative_path: str
@@ -41,6 +46,12 @@ class FileInfo:
     is_entry_point: bool = False
     is_config: bool = False
     is_test: bool = False
+    parts: Tuple[str, ...] = field(init=False, repr=False)
+    top_dir: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.parts = tuple(self.relative_path.split("/"))
+        self.top_dir = self.parts[0] if len(self.parts) > 1 else ""
 
 
 @dataclass
@@ -263,7 +274,10 @@ def analyze_codebase(
 
             return result
 
-        # Full scan (non-dry-run)
+        # Full scan (non-dry-run): read everything first, then count
+        # tokens in a single batch — encode_batch parallelizes the
+        # encoding across threads, so this beats counting per file
+        readable_files = []
         for filepath in traverse_directory(result.root):
             relative = str(filepath.relative_to(result.root))
 
@@ -279,9 +293,12 @@ def analyze_codebase(
                 result.skipped_files.append((relative, "Could not read file"))
                 continue
 
-            # Count tokens
-            tokens = count_tokens(content)
+            readable_files.append((filepath, relative, content))
+
+        # Count tokens
+        token_counts = count_tokens_batch([content for _, _, content in readable_files])
 
+        for (filepath, relative, content), tokens in zip(readable_files, token_counts):
             # Create file info
             file_info = FileInfo(
                 path=filepath,
@@ -379,7 +396,9 @@ def get_critical_files(result: AnalysisResult, limit: int = 20) -> List[FileInfo
     """Get the most critical files from the analysis.
 
     Prioritizes entry points, config files, and files with high token counts
-    while excluding test files.
+    while excluding test files. The scored ordering is computed once and
+    cached on the result, so calls with different limits are just slices;
+    the cache assumes result.files is not mutated after analysis.
 
     Args:
         result: Analysis result
@@ -388,6 +407,9 @@ def get_critical_files(result: AnalysisResult, limit: int = 20) -> List[FileInfo
     Returns:
         List of critical FileInfo objects
     """
+    cached = getattr(result, "_critical_sorted", None)
+    if cached is not None:
+        return cached[:limit]
 
     def score_file(f: FileInfo) -> int:
         """Score a file for importance."""
@@ -422,8 +444,9 @@ def get_critical_files(result: AnalysisResult, limit: int = 20) -> List[FileInfo
     # Filter out test files for critical files list
     non_test_files = [f for f in result.files if not f.is_test]
 
-    # Sort by score and return top N
+    # Sort by score once, cache, and return top N
     sorted_files = sorted(non_test_files, key=score_file, reverse=True)
+    result._critical_sorted = sorted_files
     return sorted_files[:limit]
 
 
@@ -448,8 +471,7 @@ def chunk_files(
     # Group files by top-level directory
     dir_groups: Dict[str, List[FileInfo]] = {}
     for f in files:
-        parts = f.relative_path.split("/")
-        top_dir = parts[0] if len(parts) > 1 else "(root)"
+        top_dir = f.top_dir or "(root)"
         if top_dir not in dir_groups:
             dir_groups[top_dir] = []
         dir_groups[top_dir].append(f)
@@ -529,3 +529,55 @@ class TestExplainCommand:
 
             # Should exit due to missing API key
             assert result.exit_code == 1
+
+
+class TestNetCheckCache:
+    """Tests for the connectivity-probe marker file."""
+
+    def test_fresh_marker_skips_probe(self, monkeypatch, tmp_path):
+        """A marker younger than the TTL should skip the connectivity check."""
+        from code_guro import cli
+
+        marker = tmp_path / "net_ok.ts"
+        marker.touch()
+        monkeypatch.setattr("code_guro.cli._net_check_cache_file", lambda: marker)
+
+        probes = []
+        monkeypatch.setattr(
+            "code_guro.cli.check_internet_connection", lambda: probes.append(1) or True
+        )
+
+        @cli.require_internet_decorator
+        def command():
+            return "ran"
+
+        assert command() == "ran"
+        assert probes == []
+
+    def test_stale_marker_probes_and_refreshes(self, monkeypatch, tmp_path):
+        """A marker older than the TTL should probe again and refresh the marker."""
+        import os
+        import time
+
+        from code_guro import cli
+
+        marker = tmp_path / "net_ok.ts"
+        marker.touch()
+        stale = time.time() - cli._NET_CHECK_TTL_SECONDS - 1
+        os.utime(marker, (stale, stale))
+        monkeypatch.setattr("code_guro.cli._net_check_cache_file", lambda: marker)
+
+        probes = []
+        monkeypatch.setattr(
+            "code_guro.cli.check_internet_connection", lambda: probes.append(1) or True
+        )
+        monkeypatch.setattr("code_guro.cli.get_provider_config", lambda: "anthropic")
+
+        @cli.require_internet_decorator
+        def command():
+            return "ran"
+
+        assert command() == "ran"
+        assert probes == [1]
+        # The successful probe should have refreshed the marker's mtime
+        assert time.time() - marker.stat().st_mtime < cli._NET_CHECK_TTL_SECONDS
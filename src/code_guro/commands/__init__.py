@@ -0,0 +1 @@
+"""Subcommand implementations, imported on demand by the CLI group."""
@@ -0,0 +1,194 @@
+"""Implementation of the `analyze` subcommand.
+
+Loaded on demand by the LazyGroup in cli.py, so `--help`/`--version`
+and sibling commands never pay for this module.
+"""
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import click
+
+from code_guro.cli import (
+    _GLYPHS,
+    _doc_summary,
+    _emoji_pref,
+    _get_console,
+    _resolve,
+    require_ready_decorator,
+)
+
+
+@click.command()
+@click.argument("path", type=click.Path(exists=False))
+@click.option(
+    "--markdown-only",
+    is_flag=True,
+    help="Generate only markdown files (default: generates both HTML and markdown)",
+)
+@click.option(
+    "--no-emoji",
+    is_flag=True,
+    help="Disable emoji in console output",
+)
+@require_ready_decorator
+def analyze(path: str, markdown_only: bool, no_emoji: bool):
+    """Analyze a codebase and generate learning documentation.
+
+    By default, generates both HTML and markdown files organized in subdirectories.
+    HTML files include fully rendered Mermaid diagrams for the best viewing experience.
+
+    PATH can be a local directory or a GitHub repository URL.
+
+    Examples:
+
+        code-guro analyze .
+
+        code-guro analyze /path/to/project
+
+        code-guro analyze https://github.com/user/repo
+
+        code-guro analyze . --markdown-only
+
+        code-guro analyze . --no-emoji
+    """
+    import time
+
+    from code_guro.analyzer import analyze_codebase, confirm_analysis
+    from code_guro.config import get_preference, set_preference
+    from code_guro.generator import generate_documentation
+    from code_guro.utils import is_github_url
+
+    console = _get_console()
+
+    # Check emoji preference (flag overrides config)
+    use_emoji = False if no_emoji else _emoji_pref()
+
+    # Save preference if explicitly set via flag
+    if no_emoji and get_preference("emoji_enabled") is not False:
+        set_preference("emoji_enabled", False)
+        _emoji_pref.cache_clear()
+
+    # Progress indicators
+    glyphs = _GLYPHS[use_emoji]
+    check_mark = glyphs["check"]
+    hourglass = glyphs["hourglass"]
+    doc = glyphs["doc"]
+    globe = glyphs["globe"]
+
+    console.print()
+    if use_emoji:
+        console.print(f"[bold]{glyphs['chart']} Understanding your codebase...[/bold]")
+    else:
+        console.print("[bold]Understanding your codebase...[/bold]")
+    console.print()
+
+    # Validate path with a single stat instead of exists() + is_dir()
+    if not is_github_url(path):
+        path_obj = Path(path).resolve()
+        try:
+            path_mode = os.stat(path_obj).st_mode
+        except OSError:
+            console.print(f"[red]Error:[/red] Directory not found: {path}")
+            sys.exit(1)
+        if not stat.S_ISDIR(path_mode):
+            console.print(f"[red]Error:[/red] Not a directory: {path}")
+            sys.exit(1)
+
+    # Track milestones
+    milestones = []
+
+    def track_progress(event: str, data: dict):
+        """Progress callback for milestone tracking."""
+        if event == "scan_complete":
+            duration = data.get("duration", 0)
+            file_count = data.get("file_count", 0)
+            milestones.append(
+                (
+                    "scan",
+                    f"{check_mark} Scanned {file_count} files ({duration:.1f} seconds)",
+                )
+            )
+            console.print(milestones[-1][1])
+        elif event == "framework_detected":
+            duration = data.get("duration", 0)
+            frameworks = data.get("frameworks", [])
+            framework_names = ", ".join(f.name for f in frameworks)
+            milestones.append(
+                (
+                    "framework",
+                    f"{check_mark} Detected {framework_names} ({duration:.1f} seconds)",
+                )
+            )
+            console.print(milestones[-1][1])
+
+    try:
+        # Analyze codebase
+        analysis_start = time.time()
+        result = analyze_codebase(path, progress_callback=track_progress)
+
+        if not result.files:
+            console.print(
+                "\n[yellow]Warning:[/yellow] No analyzable files found.\n"
+                "The directory may be empty or contain only binary/ignored files."
+            )
+            sys.exit(1)
+
+        # Confirm if cost is high
+        if not confirm_analysis(result):
+            console.print("[yellow]Analysis cancelled.[/yellow]")
+            sys.exit(0)
+
+        # Generate documentation
+        console.print()
+        time.time()
+
+        # Estimate time based on tokens (rough estimate: 1000 tokens per second)
+        estimated_seconds = result.total_tokens / 1000
+        console.print(
+            f"{hourglass} Generating documentation... "
+            f"(~{int(estimated_seconds)} seconds estimated)"
+        )
+
+        output_dir = generate_documentation(result, markdown_only=markdown_only)
+
+        total_elapsed = time.time() - analysis_start
+
+        console.print(f"{check_mark} Documentation ready! ({int(total_elapsed)} seconds total)")
+        console.print()
+
+        # Print summary
+        console.print("[bold green]Analysis complete![/bold green]")
+        console.print()
+
+        if markdown_only:
+            console.print(f"{doc} Generated documents:")
+            # scandir + endswith: we only need names, so skip glob's
+            # pattern compilation; the d_type check costs no extra stat
+            with os.scandir(output_dir) as entries:
+                md_names = sorted(e.name for e in entries if e.name.endswith(".md") and e.is_file())
+            # One render pass for the whole listing instead of a print
+            # (and a markup parse) per file
+            console.print("\n".join(f"  • [cyan]{name}[/cyan]" for name in md_names))
+            console.print()
+            console.print(f"[dim]Open {output_dir}/00-overview.md to start learning![/dim]")
+        else:
+            # Both formats generated in subdirectories
+            output_dir / "markdown"
+            html_dir = output_dir / "html"
+
+            console.print(f"{doc} Generated documentation:")
+            console.print(_doc_summary())
+            console.print()
+            console.print(
+                f"{globe} [dim]Open {html_dir}/00-overview.html in your browser for the best experience![/dim]"
+            )
+
+        console.print()
+
+    except Exception as e:
+        provider_name = _resolve("resolve_provider_name_for_error")(e)
+        _resolve("handle_api_error")(e, provider_name)
+        sys.exit(1)
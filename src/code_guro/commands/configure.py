@@ -0,0 +1,185 @@
+"""Implementation of the `configure` subcommand.
+
+Loaded on demand by the LazyGroup in cli.py, so `--help`/`--version`
+and sibling commands never pay for this module.
+"""
+
+import sys
+
+import click
+
+from code_guro.cli import (
+    _GLYPHS,
+    _emoji_pref,
+    _get_console,
+    _resolve,
+)
+
+
+@click.command()
+@click.option(
+    "--skip-validation",
+    is_flag=True,
+    help="Skip API key validation (useful in CI or offline setups)",
+)
+def configure(skip_validation: bool):
+    """Configure Code Guro with your LLM provider.
+
+    This command will guide you through selecting a provider and setting up
+    your API key with interactive prompts and immediate validation.
+    """
+    from rich.prompt import Confirm, Prompt
+
+    from code_guro.config import save_api_key_to_config
+    from code_guro.providers.factory import get_provider, list_provider_metadata
+
+    console = _get_console()
+
+    # Check emoji preference
+    check_mark = _GLYPHS[_emoji_pref()]["check"]
+
+    console.print()
+    console.print("[bold]Code Guro Configuration[/bold]")
+    console.print()
+
+    # Check if already configured
+    current_provider_name = _resolve("get_provider_config")()
+    if current_provider_name:
+        try:
+            current_provider = get_provider(current_provider_name)
+            current_key = current_provider.get_api_key()
+            if current_key:
+                console.print(
+                    f"[dim]Current provider:[/dim] [cyan]{current_provider.get_provider_name()}[/cyan]"
+                )
+                console.print(
+                    f"[dim]Current API key:[/dim] [cyan]{_resolve('mask_api_key')(current_key)}[/cyan]"
+                )
+                console.print()
+
+                if not Confirm.ask("Would you like to change your configuration?", default=False):
+                    console.print("[yellow]Configuration unchanged.[/yellow]")
+                    return
+                console.print()
+        except Exception:
+            # Provider config exists but invalid, allow reconfiguration
+            pass
+
+    # Provider selection with detailed descriptions; the metadata is
+    # static, so nothing is instantiated until a provider is chosen
+    console.print("[bold]Select your LLM provider:[/bold]")
+    console.print()
+
+    provider_metadata = list_provider_metadata()
+    for i, (_provider_id, name, best_for, cost, url) in enumerate(provider_metadata, 1):
+        console.print(f"  [bold]{i}. {name}[/bold]")
+        console.print(f"     [dim]• Best for:[/dim] {best_for}")
+        console.print(f"     [dim]• Cost:[/dim] {cost}")
+        console.print(f"     [dim]• Get API key:[/dim] {url}")
+        console.print()
+
+    try:
+        choice = Prompt.ask(
+            "Enter choice",
+            choices=[str(i) for i in range(1, len(provider_metadata) + 1)],
+            default="1",
+        )
+        selected_provider_id = provider_metadata[int(choice) - 1][0]
+    except (ValueError, IndexError, KeyboardInterrupt):
+        console.print("[yellow]Configuration cancelled.[/yellow]")
+        sys.exit(0)
+
+    selected_provider = get_provider(selected_provider_id)
+    selected_name = selected_provider.get_provider_name()
+    selected_url = selected_provider.get_api_key_url()
+
+    console.print()
+    console.print(f"[bold]Setting up {selected_name}[/bold]")
+    console.print()
+
+    # Pick the key to configure; the network validation happens exactly
+    # once below, on the key that will actually be saved
+    api_key = selected_provider.get_api_key()
+    using_existing_key = False
+
+    if api_key:
+        console.print(
+            f"[dim]Found API key in config or environment: {_resolve('mask_api_key')(api_key)}[/dim]"
+        )
+        if Confirm.ask("Use this API key?", default=True):
+            using_existing_key = True
+        else:
+            # User declined to use existing key - prompt for new one
+            api_key = None
+
+    # Prompt for API key input
+    if not api_key:
+        console.print(f"Please enter your {selected_name} API key:")
+        console.print(f"[dim]Get your key at: {selected_url}[/dim]")
+        console.print()
+
+        api_key = Prompt.ask("API key (will be hidden)", password=True)
+
+        if not api_key or not api_key.strip():
+            console.print("[red]Error:[/red] API key cannot be empty.")
+            sys.exit(1)
+
+        api_key = api_key.strip()
+
+    # Validate the key. For a key that's already in config/env, a recent
+    # successful validation of the same provider/key pair is trusted, so
+    # repeat configure runs skip the network round-trip; a newly typed
+    # key is always validated.
+    from code_guro.config import check_validation_cache, record_validation_success
+
+    if (
+        not skip_validation
+        and using_existing_key
+        and check_validation_cache(selected_provider_id, api_key)
+    ):
+        console.print()
+        console.print("[dim]API key recently validated; skipping check.[/dim]")
+    elif not skip_validation:
+        console.print()
+        console.print("[dim]Validating API key...[/dim]")
+
+        is_valid, message = selected_provider.validate_api_key(api_key)
+
+        if not is_valid:
+            console.print()
+            console.print(f"[red]Error:[/red] {message}")
+            console.print()
+            console.print("Please check your API key and try again.")
+            console.print("Run [bold cyan]code-guro configure[/bold cyan] to retry.")
+            sys.exit(1)
+
+        record_validation_success(selected_provider_id, api_key)
+
+    # Save configuration. An existing key is already stored in config or
+    # the environment, so only newly entered keys are written out.
+    _resolve("save_provider_config")(selected_provider_id)
+    if using_existing_key:
+        console.print()
+        console.print(f"[green]{check_mark} API key is valid![/green]")
+        console.print(f"[green]{check_mark} Provider saved: {selected_name}[/green]")
+        console.print()
+        console.print(
+            "You can now use [bold cyan]code-guro analyze[/bold cyan] to analyze a codebase."
+        )
+        return
+    save_api_key_to_config(selected_provider_id, api_key)
+
+    console.print()
+    console.print(
+        f"[green]{check_mark} Success! Your API key is valid and has been saved securely.[/green]"
+    )
+    console.print()
+    console.print(f"[dim]Configuration saved to: {_resolve('get_config_file')()}[/dim]")
+    console.print()
+    console.print("[bold]You're all set![/bold] Try analyzing a project:")
+    console.print("  [cyan]cd /path/to/your/project[/cyan]")
+    console.print("  [cyan]code-guro[/cyan]")
+    console.print()
+    console.print("[dim]Or specify a path explicitly:[/dim]")
+    console.print("  [cyan]code-guro analyze /path/to/project[/cyan]")
+    console.print()
@@ -0,0 +1,122 @@
+"""Implementation of the `convert` subcommand.
+
+Loaded on demand by the LazyGroup in cli.py, so `--help`/`--version`
+and sibling commands never pay for this module.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import click
+
+from code_guro.cli import (
+    _get_console,
+)
+
+
+@click.command()
+@click.argument(
+    "output_dir",
+    type=click.Path(resolve_path=True, path_type=Path),
+    default="code-guro-output",
+    required=False,
+)
+def convert(output_dir: Path):
+    """Convert markdown-only output to include HTML files.
+
+    OUTPUT_DIR is the directory containing markdown files (default: code-guro-output).
+
+    Useful if you previously ran 'code-guro analyze --markdown-only' and now want
+    to add HTML files. Organizes files into markdown/ and html/ subdirectories.
+
+    Examples:
+
+        code-guro convert
+
+        code-guro convert ./code-guro-output
+
+        code-guro convert /path/to/output
+    """
+
+    console = _get_console()
+    # Click already resolved the argument (resolve_path=True), so no
+    # second realpath walk is needed here
+    output_path = output_dir
+
+    console.print()
+    console.print("[bold]Code Guro Convert[/bold]")
+    console.print()
+
+    # Validate directory exists
+    if not output_path.exists():
+        console.print(f"[red]Error:[/red] Directory not found: {output_dir}")
+        console.print()
+        console.print(
+            "Run [bold cyan]code-guro analyze[/bold cyan] first to generate documentation."
+        )
+        sys.exit(1)
+
+    if not output_path.is_dir():
+        console.print(f"[red]Error:[/red] Not a directory: {output_dir}")
+        sys.exit(1)
+
+    # Check for markdown files; one listdir pass feeds both the count
+    # and the move loop below
+    md_names = [n for n in os.listdir(output_path) if n.endswith(".md")]
+    if not md_names:
+        console.print(f"[yellow]Warning:[/yellow] No markdown files found in {output_dir}")
+        console.print()
+        console.print("This directory doesn't appear to contain Code Guro output.")
+        sys.exit(1)
+
+    try:
+        console.print(f"[dim]Converting {len(md_names)} markdown file(s) to HTML...[/dim]")
+        console.print("[dim]Organizing files into subdirectories...[/dim]")
+        console.print()
+
+        # Create subdirectories
+        markdown_dir = output_path / "markdown"
+        html_dir = output_path / "html"
+        markdown_dir.mkdir(exist_ok=True)
+        html_dir.mkdir(exist_ok=True)
+
+        # Move markdown files to markdown/ subdirectory. It's a child of
+        # output_path, hence the same filesystem, so a direct rename is
+        # enough — shutil.move's stat checks and copy fallback never fire.
+        # os.replace also overwrites stale targets on Windows, where a
+        # plain rename would raise.
+        src_dir = str(output_path)
+        dst_dir = str(markdown_dir)
+        for name in md_names:
+            os.replace(os.path.join(src_dir, name), os.path.join(dst_dir, name))
+
+        # Convert markdown to HTML in html/ subdirectory
+        from code_guro.html_converter import convert_directory_to_html_organized
+
+        convert_directory_to_html_organized(markdown_dir, html_dir)
+
+        # Count generated files; names and counts are all that's needed,
+        # so a scandir + suffix filter beats glob's pattern machinery
+        with os.scandir(markdown_dir) as entries:
+            md_moved_count = sum(1 for e in entries if e.name.endswith(".md") and e.is_file())
+        with os.scandir(html_dir) as entries:
+            html_count = sum(1 for e in entries if e.name.endswith(".html") and e.is_file())
+
+        console.print("[bold green]Conversion complete![/bold green]")
+        console.print()
+        # One print for the whole tree: each console.print re-enters
+        # Rich's markup parser and render pipeline, so batch the lines
+        console.print(
+            "Directory structure:\n"
+            f"  [cyan]{output_path.name}/[/cyan]\n"
+            f"    [cyan]markdown/[/cyan] ({md_moved_count} files)\n"
+            f"    [cyan]html/[/cyan] ({html_count} files)"
+        )
+        console.print()
+        console.print(f"[dim]Open {html_dir}/00-overview.html in your browser![/dim]")
+        console.print()
+
+    except Exception as e:
+        console.print(f"[red]Error during conversion:[/red] {str(e)}")
+        sys.exit(1)
@@ -0,0 +1,144 @@
+"""Implementation of the `explain` subcommand.
+
+Loaded on demand by the LazyGroup in cli.py, so `--help`/`--version`
+and sibling commands never pay for this module.
+"""
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import click
+
+from code_guro.cli import (
+    _get_console,
+    _resolve,
+    require_ready_decorator,
+)
+
+
+@click.command()
+@click.argument("path", type=click.Path(exists=False))
+@click.option(
+    "--interactive",
+    "-i",
+    is_flag=True,
+    help="Launch interactive mode for follow-up questions",
+)
+@click.option(
+    "--output",
+    type=click.Choice(["file", "console"]),
+    default="file",
+    help="Where to output the explanation (default: file)",
+)
+@require_ready_decorator
+def explain(path: str, interactive: bool, output: str):
+    """Explain a specific file or folder in depth.
+
+    PATH must be a file or folder within a previously analyzed codebase.
+
+    Examples:
+
+        code-guro explain ./src/auth
+
+        code-guro explain ./src/auth/login.ts --interactive
+
+        code-guro explain ./src/auth --output console
+    """
+    from code_guro.generator import create_output_dir, generate_explain_document
+    from code_guro.utils import read_file_safely, traverse_directory
+
+    console = _get_console()
+    # resolve() walks and stats every path component; skip it when the
+    # argument is already absolute
+    path_obj = Path(path) if os.path.isabs(path) else Path(path).resolve()
+    # One stat up front answers both the existence and the
+    # file-vs-directory questions; click's exists=True would have paid a
+    # separate stat inside the type converter before the command ran
+    try:
+        path_mode = os.stat(path_obj).st_mode
+    except OSError:
+        _get_console().print(f"[red]Error:[/red] Path not found: {path}")
+        sys.exit(1)
+    is_file = stat.S_ISREG(path_mode)
+
+    console.print()
+    console.print("[bold]Code Guro Explain[/bold]")
+    console.print()
+    console.print(f"[dim]Analyzing: {path}[/dim]")
+
+    try:
+        # Get content to explain
+        if is_file:
+            content = read_file_safely(path_obj)
+            if content is None:
+                console.print(f"[red]Error:[/red] Could not read file: {path}")
+                sys.exit(1)
+        else:
+            # It's a directory - read all files, overlapping the disk I/O
+            # in a thread pool (file reads release the GIL). executor.map
+            # preserves ordering; tiny directories skip the pool overhead.
+            paths = list(traverse_directory(path_obj))
+            if len(paths) > 4:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+                    contents = list(executor.map(read_file_safely, paths))
+            else:
+                contents = [read_file_safely(f) for f in paths]
+
+            # Assemble the prompt body as flat fragments and join once,
+            # instead of allocating an intermediate f-string per file
+            parts = []
+            append = parts.append
+            for f, file_content in zip(paths, contents):
+                if file_content:
+                    if parts:
+                        append("\n")
+                    append("## ")
+                    append(os.path.relpath(f, path_obj))
+                    append("\n```\n")
+                    append(file_content)
+                    append("\n```\n")
+            content = "".join(parts)
+
+        if not content:
+            console.print(f"[yellow]Warning:[/yellow] No content to explain in {path}")
+            sys.exit(1)
+
+        # Detect frameworks from the nearest project root
+        from code_guro.utils import find_project_root
+
+        parent = find_project_root(path_obj.parent if is_file else path_obj)
+
+        from code_guro.frameworks import detect_frameworks
+
+        frameworks = detect_frameworks(parent)
+
+        if interactive:
+            # Launch interactive mode
+            from code_guro.repl import start_repl
+
+            start_repl(path_obj, content, frameworks)
+        else:
+            # Generate explanation document
+            console.print("[dim]Generating explanation...[/dim]")
+            doc = generate_explain_document(path_obj, content, frameworks)
+
+            if output == "console":
+                console.print()
+                console.print(doc)
+            else:
+                # Save to file
+                output_dir = create_output_dir(parent)
+                filename = f"explain-{path_obj.name.replace('/', '-')}.md"
+                filepath = output_dir / filename
+                filepath.write_text(doc)
+                console.print()
+                console.print(f"[green]Explanation saved to:[/green] {filepath}")
+
+    except Exception as e:
+        provider_name = _resolve("resolve_provider_name_for_error")(e)
+        _resolve("handle_api_error")(e, provider_name)
+        sys.exit(1)
@@ -6,9 +6,12 @@ API keys are stored in environment variables only.
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
 import json
 import os
-import stat
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -16,13 +19,18 @@ from rich.console import Console
 
 console = Console()
 
-# Valid provider names
-VALID_PROVIDERS = ["anthropic", "openai", "google"]
+# Valid provider names. The frozenset gives O(1) membership checks;
+# PROVIDER_ORDER preserves the canonical listing order for messages.
+PROVIDER_ORDER = ("anthropic", "openai", "google")
+VALID_PROVIDERS = frozenset(PROVIDER_ORDER)
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """Get the configuration directory path.
 
+    The location is process-constant, so it is computed once.
+
     Returns:
         Path to ~/.config/code-guro/
     """
@@ -45,6 +53,7 @@ def ensure_config_dir() -> Path:
     return config_dir
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_file() -> Path:
     """Get the path to the config file.
 
@@ -54,22 +63,43 @@ def get_config_file() -> Path:
     return get_config_dir() / "config.json"
 
 
+# Parsed-config cache keyed on (path, mtime_ns, size). read_config runs on
+# every guarded command invocation, often several times, and the JSON never
+# changes mid-run unless write_config below wrote it.
+_config_cache: Optional[tuple] = None
+
+
 def read_config() -> dict:
     """Read the configuration from disk.
 
+    The parsed result is cached against the file's identity and mtime, so
+    repeat calls cost one stat instead of an open + JSON parse. Callers
+    receive a copy and may mutate it freely.
+
     Returns:
         Configuration dictionary
     """
+    global _config_cache
+
     config_file = get_config_file()
-    if not config_file.exists():
+    try:
+        st = config_file.stat()
+    except OSError:
         return {}
 
+    cache_key = (str(config_file), st.st_mtime_ns, st.st_size)
+    if _config_cache is not None and _config_cache[0] == cache_key:
+        return copy.deepcopy(_config_cache[1])
+
     try:
         with open(config_file) as f:
-            return json.load(f)
+            config = json.load(f)
     except (OSError, json.JSONDecodeError):
         return {}
 
+    _config_cache = (cache_key, copy.deepcopy(config))
+    return config
+
 
 def write_config(config: dict) -> None:
     """Write configuration to disk with secure permissions.
@@ -77,16 +107,25 @@ def write_config(config: dict) -> None:
     Args:
         config: Configuration dictionary to save
     """
-    config_dir = ensure_config_dir()
-    config_file = config_dir / "config.json"
+    global _config_cache
+
+    ensure_config_dir()
+    config_file = get_config_file()
 
-    # Write the file
-    with open(config_file, "w") as f:
+    # Create the file 0600 from the start instead of chmod-ing after the
+    # write; the key material is never briefly world-readable and the
+    # extra syscall goes away. (The mode only applies on creation, which
+    # is fine — files this module wrote before were already 0600.)
+    fd = os.open(config_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
         json.dump(config, f, indent=2)
 
-    # Set restrictive permissions (chmod 600) on non-Windows systems
-    if os.name != "nt":
-        os.chmod(config_file, stat.S_IRUSR | stat.S_IWUSR)
+    # Freshen the read cache so the next read_config skips the disk
+    try:
+        st = config_file.stat()
+        _config_cache = ((str(config_file), st.st_mtime_ns, st.st_size), copy.deepcopy(config))
+    except OSError:
+        _config_cache = None
 
 
 def get_preference(key: str, default=None):
@@ -129,7 +168,7 @@ def save_api_key_to_config(provider: str, api_key: str) -> None:
         API keys are stored in plain text with secure file permissions (0o600).
     """
     if provider not in VALID_PROVIDERS:
-        raise ValueError(f"Invalid provider: {provider}. Valid providers: {VALID_PROVIDERS}")
+        raise ValueError(f"Invalid provider: {provider}. Valid providers: {list(PROVIDER_ORDER)}")
 
     config = read_config()
 
@@ -184,7 +223,7 @@ def save_provider_config(provider: str) -> None:
         provider: The provider name to save (must be in VALID_PROVIDERS)
     """
     if provider not in VALID_PROVIDERS:
-        raise ValueError(f"Invalid provider: {provider}. Valid providers: {VALID_PROVIDERS}")
+        raise ValueError(f"Invalid provider: {provider}. Valid providers: {list(PROVIDER_ORDER)}")
 
     config = read_config()
     config["provider"] = provider
@@ -194,9 +233,84 @@ def save_provider_config(provider: str) -> None:
     write_config(config)
 
 
+# How long a successful key validation is trusted before re-checking
+_VALIDATION_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def get_validation_cache_file() -> Path:
+    """Get the path to the validation-result cache file.
+
+    Returns:
+        Path to validation_cache.json
+    """
+    return get_config_dir() / "validation_cache.json"
+
+
+def _validation_cache_key(provider: str, api_key: str) -> str:
+    """Build the cache key for a provider/API-key pair.
+
+    Only a truncated SHA-256 of the key is stored, never the key itself.
+    """
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    return f"{provider}:{key_hash}"
+
+
+def check_validation_cache(provider: str, api_key: str) -> bool:
+    """Check whether this provider/key pair validated successfully recently.
+
+    Args:
+        provider: Provider name
+        api_key: The API key to look up
+
+    Returns:
+        True if a successful validation is cached and within the TTL
+    """
+    try:
+        with open(get_validation_cache_file()) as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return False
+
+    entry = cache.get(_validation_cache_key(provider, api_key))
+    if not isinstance(entry, dict):
+        return False
+    return time.time() - entry.get("validated_at", 0) < _VALIDATION_CACHE_TTL_SECONDS
+
+
+def record_validation_success(provider: str, api_key: str) -> None:
+    """Record a successful API key validation.
+
+    Only successes are cached — a failed key should always be retried
+    against the provider.
+
+    Args:
+        provider: Provider name
+        api_key: The API key that validated
+    """
+    cache_file = get_validation_cache_file()
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+
+    cache[_validation_cache_key(provider, api_key)] = {"validated_at": time.time()}
+
+    ensure_config_dir()
+    fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(cache, f, indent=2)
+
+
+@functools.lru_cache(maxsize=8)
 def mask_api_key(api_key: str) -> str:
     """Mask an API key for safe display.
 
+    The same key is masked repeatedly within a configure run, so the
+    handful of keys a process ever sees are cached.
+
     Args:
         api_key: The API key to mask
 
@@ -259,6 +373,11 @@ def is_provider_configured() -> bool:
         return False
 
 
+# Legacy environment variables checked by get_api_key, hoisted so the
+# lookup loop doesn't rebuild the list per call
+_LEGACY_ENV_VARS = ("CLAUDE_API_KEY", "ANTHROPIC_API_KEY")
+
+
 # Backwards compatibility functions (deprecated)
 def get_api_key() -> Optional[str]:
     """DEPRECATED: Get API key from environment or legacy config.
@@ -270,7 +389,7 @@ def get_api_key() -> Optional[str]:
         API key string or None if not configured
     """
     # Check environment variables first (legacy Anthropic behavior)
-    for env_var in ["CLAUDE_API_KEY", "ANTHROPIC_API_KEY"]:
+    for env_var in _LEGACY_ENV_VARS:
         key = os.environ.get(env_var)
         if key:
             return key
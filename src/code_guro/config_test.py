@@ -2,16 +2,19 @@
 
 import os
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 from code_guro.config import (
+    check_validation_cache,
     get_api_key,
     get_config_dir,
     get_config_file,
     is_api_key_configured,
     mask_api_key,
     read_config,
+    record_validation_success,
     write_config,
 )
 
@@ -101,6 +104,61 @@ class TestApiKey:
             assert is_api_key_configured() is False
 
 
+class TestValidationCache:
+    """Tests for the key-validation result cache."""
+
+    def test_check_hit_within_ttl(self):
+        """A recorded validation should be trusted within the TTL."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "validation_cache.json"
+
+            with patch("code_guro.config.get_validation_cache_file", return_value=cache_path):
+                with patch("code_guro.config.ensure_config_dir"):
+                    record_validation_success("anthropic", "sk-test-key")
+                    assert check_validation_cache("anthropic", "sk-test-key") is True
+                    # Different key or provider should not hit
+                    assert check_validation_cache("anthropic", "sk-other-key") is False
+                    assert check_validation_cache("openai", "sk-test-key") is False
+
+    def test_check_miss_after_ttl(self):
+        """A validation older than the TTL should not be trusted."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "validation_cache.json"
+
+            with patch("code_guro.config.get_validation_cache_file", return_value=cache_path):
+                with patch("code_guro.config.ensure_config_dir"):
+                    record_validation_success("anthropic", "sk-test-key")
+
+                # Pretend the TTL has elapsed since the entry was written
+                day_later = time.time() + 24 * 60 * 60 + 1
+                with patch("code_guro.config.time.time", return_value=day_later):
+                    assert check_validation_cache("anthropic", "sk-test-key") is False
+
+    def test_corrupt_cache_file_falls_back(self):
+        """A corrupt cache file should behave like an empty cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "validation_cache.json"
+            cache_path.write_text("not json {")
+
+            with patch("code_guro.config.get_validation_cache_file", return_value=cache_path):
+                with patch("code_guro.config.ensure_config_dir"):
+                    assert check_validation_cache("anthropic", "sk-test-key") is False
+                    # Recording should overwrite the corrupt file
+                    record_validation_success("anthropic", "sk-test-key")
+                    assert check_validation_cache("anthropic", "sk-test-key") is True
+
+    def test_cache_does_not_store_raw_key(self):
+        """The cache file should never contain the API key itself."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "validation_cache.json"
+
+            with patch("code_guro.config.get_validation_cache_file", return_value=cache_path):
+                with patch("code_guro.config.ensure_config_dir"):
+                    record_validation_success("anthropic", "sk-secret-key")
+
+            assert "sk-secret-key" not in cache_path.read_text()
+
+
 class TestMaskApiKey:
     """Tests for API key masking."""
 
@@ -1,18 +1,83 @@
 """Custom exceptions and error handling for Code Guro."""
 
+import functools
+import re
+import socket
+import time
+from typing import Optional
+
 from rich.console import Console
 
 console = Console()
 
+# Provider-specific API endpoints, also used for connection pre-warming
+API_ENDPOINTS = {
+    "anthropic": ("api.anthropic.com", 443),
+    "openai": ("api.openai.com", 443),
+    "google": ("generativelanguage.googleapis.com", 443),
+}
+
+# Resolved addresses are reused for a minute so repeated connectivity
+# checks (decorator probe, error handling) skip the DNS round-trip
+_DNS_CACHE_TTL_SECONDS = 60.0
+_dns_cache: dict = {}
+
+
+def _resolve_cached(host: str, port: int):
+    """Resolve a host, reusing a recent getaddrinfo result.
+
+    Args:
+        host: Hostname to resolve
+        port: Port number
+
+    Returns:
+        List of getaddrinfo tuples
+
+    Raises:
+        OSError: If resolution fails
+    """
+    now = time.monotonic()
+    cached = _dns_cache.get((host, port))
+    if cached is not None and now - cached[0] < _DNS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    infos = socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)
+    _dns_cache[(host, port)] = (now, infos)
+    return infos
+
 
 class CodeGuroError(Exception):
-    """Base exception for Code Guro."""
+    """Base exception for Code Guro.
 
-    def __init__(self, message: str, hint: str = ""):
-        self.message = message
-        self.hint = hint
+    message and hint may be str.format templates; with format_kwargs
+    given, formatting is deferred until the text is actually read, so
+    errors raised purely for flow control never pay for it. The raw
+    template stays available for grouping/logging.
+    """
+
+    def __init__(self, message: str, hint: str = "", format_kwargs: Optional[dict] = None):
+        self.template = message
+        self.hint_template = hint
+        self._format_kwargs = format_kwargs
         super().__init__(message)
 
+    @functools.cached_property
+    def message(self) -> str:
+        """The formatted error message."""
+        if self._format_kwargs:
+            return self.template.format(**self._format_kwargs)
+        return self.template
+
+    @functools.cached_property
+    def hint(self) -> str:
+        """The formatted hint text."""
+        if self._format_kwargs:
+            return self.hint_template.format(**self._format_kwargs)
+        return self.hint_template
+
+    def __str__(self) -> str:
+        return self.message
+
     def display(self):
         """Display the error message with formatting."""
         console.print(f"\n[bold red]Error:[/bold red] {self.message}")
@@ -122,44 +187,131 @@ def get_error(error_type: str, **kwargs) -> CodeGuroError:
         return CodeGuroError(f"Unknown error: {error_type}")
 
     message, hint = ERROR_MESSAGES[error_type]
-    return CodeGuroError(message.format(**kwargs), hint.format(**kwargs))
+    return CodeGuroError(message, hint, format_kwargs=kwargs)
 
 
 def check_internet_connection(provider_name: str = None) -> bool:
     """Check if there is an internet connection to the provider's API.
 
+    This is a DNS-only probe: resolving the endpoint proves the
+    resolver path works without paying for a TCP connect, which used
+    to block for up to 5 seconds per endpoint in error-handling paths.
+    Resolutions are served from a short-TTL cache, so repeated checks
+    within a run are effectively free. If DNS succeeds yet the SDK
+    still reported a connection error, the remote end was unreachable
+    and callers report a timeout rather than "no internet".
+
     Args:
         provider_name: Name of provider to check. If None, checks all providers.
 
     Returns:
         True if connected, False otherwise
     """
-    import socket
-
-    # Provider-specific API endpoints
-    endpoints = {
-        "anthropic": ("api.anthropic.com", 443),
-        "openai": ("api.openai.com", 443),
-        "google": ("generativelanguage.googleapis.com", 443),
-    }
-
     if provider_name:
-        endpoints_to_check = [endpoints.get(provider_name.lower())]
+        endpoints_to_check = [API_ENDPOINTS.get(provider_name.lower())]
     else:
-        endpoints_to_check = list(endpoints.values())
+        endpoints_to_check = list(API_ENDPOINTS.values())
 
     endpoints_to_check = [e for e in endpoints_to_check if e is not None]
 
     for host, port in endpoints_to_check:
         try:
-            socket.create_connection((host, port), timeout=5)
-            return True
+            if _resolve_cached(host, port):
+                return True
         except OSError:
             continue
 
     return False
 
 
+# Substrings that suggest an exception came from an LLM API call; used to
+# decide whether resolving the provider (an SDK import) is worth it
+_API_ERROR_MARKERS = (
+    "api key",
+    "api_key",
+    "authentication",
+    "rate limit",
+    "quota",
+    "connection",
+    "network",
+)
+
+
+def resolve_provider_name_for_error(error: Exception) -> Optional[str]:
+    """Resolve the configured provider name for error reporting.
+
+    Looking up the provider imports the SDK modules, so it is skipped
+    for exceptions that clearly did not come from an LLM API call
+    (e.g. a plain OSError from reading files).
+
+    Args:
+        error: The exception being reported
+
+    Returns:
+        Lowercase provider name, or None if unavailable or not needed
+    """
+    sdk_module = type(error).__module__.split(".")[0]
+    if sdk_module not in ("anthropic", "openai", "google"):
+        error_text = str(error).lower()
+        if not any(marker in error_text for marker in _API_ERROR_MARKERS):
+            return None
+
+    from code_guro.providers.factory import get_provider
+
+    try:
+        return get_provider().get_provider_name().lower()
+    except Exception:
+        return None
+
+
+# Single-scan alternation over the markers handle_api_error used to
+# look for with repeated substring scans; the longer "api key not ..."
+# alternatives come first so they win over plain "api_key"
+_ERROR_TEXT_RE = re.compile(
+    r"api key not (?:configured|found)"
+    r"|authentication|api_key"
+    r"|rate limit|quota"
+    r"|connection|network",
+    re.IGNORECASE,
+)
+
+# (exception type, error category) pairs for the installed SDKs; built
+# on first use so importing this module never pulls in the SDKs
+_sdk_error_dispatch = None
+
+
+def _get_sdk_error_dispatch():
+    """Build the SDK exception dispatch table once."""
+    global _sdk_error_dispatch
+    if _sdk_error_dispatch is None:
+        dispatch = []
+        for sdk_name in ("anthropic", "openai"):
+            try:
+                sdk = __import__(sdk_name)
+            except ImportError:
+                continue
+            dispatch.append((sdk.AuthenticationError, "invalid_api_key"))
+            dispatch.append((sdk.RateLimitError, "rate_limited"))
+            dispatch.append((sdk.APIConnectionError, "connection"))
+        _sdk_error_dispatch = dispatch
+    return _sdk_error_dispatch
+
+
+def _classify_sdk_error(error: Exception) -> Optional[str]:
+    """Classify an exception via the SDK dispatch table.
+
+    Args:
+        error: The exception to classify
+
+    Returns:
+        Error category key, or None if no SDK type matches
+    """
+    for exc_type, category in _get_sdk_error_dispatch():
+        if isinstance(error, exc_type):
+            return category
+    return None
+
+
 def handle_api_error(error: Exception, provider_name: str = None) -> None:
     """Handle API errors and display appropriate messages.
 
@@ -167,54 +319,34 @@ def handle_api_error(error: Exception, provider_name: str = None) -> None:
         error: The exception that occurred
         provider_name: Name of provider that raised the error (optional)
     """
-    # Try to import all provider SDKs
-    try:
-        import anthropic
-    except ImportError:
-        anthropic = None
-
-    try:
-        import openai
-    except ImportError:
-        openai = None
-
-    error_text = str(error).lower()
+    error_text = str(error)
+    # One pass over the (potentially large) error body instead of a
+    # substring scan per marker; matches keep the old priority order
+    matches = {m.lower() for m in _ERROR_TEXT_RE.findall(error_text)}
 
     # Check for missing API keys
-    if "api key not configured" in error_text or "api key not found" in error_text:
+    if "api key not configured" in matches or "api key not found" in matches:
         get_error("no_api_key").display()
         return
-    # Check for authentication errors
-    if anthropic and isinstance(error, anthropic.AuthenticationError):
-        get_error("invalid_api_key").display()
-    elif openai and isinstance(error, openai.AuthenticationError):
-        get_error("invalid_api_key").display()
-    # Check for rate limit errors
-    elif anthropic and isinstance(error, anthropic.RateLimitError):
-        get_error("rate_limited").display()
-    elif openai and isinstance(error, openai.RateLimitError):
-        get_error("rate_limited").display()
-    # Check for connection errors
-    elif anthropic and isinstance(error, anthropic.APIConnectionError):
-        if not check_internet_connection(provider_name):
-            get_error("no_internet").display()
-        else:
-            get_error("api_timeout").display()
-    elif openai and isinstance(error, openai.APIConnectionError):
-        if not check_internet_connection(provider_name):
-            get_error("no_internet").display()
+
+    # Check SDK exception types, then fall back to message markers
+    category = _classify_sdk_error(error)
+    if category is None:
+        if matches & {"authentication", "api_key"}:
+            category = "invalid_api_key"
+        elif matches & {"rate limit", "quota"}:
+            category = "rate_limited"
+        elif matches & {"connection", "network"}:
+            category = "connection"
         else:
-            get_error("api_timeout").display()
-    # Check for generic errors that might indicate API issues
-    elif "authentication" in error_text or "api_key" in error_text:
-        get_error("invalid_api_key").display()
-    elif "rate limit" in error_text or "quota" in error_text:
-        get_error("rate_limited").display()
-    elif "connection" in error_text or "network" in error_text:
+            console.print(f"\n[bold red]Error:[/bold red] {error_text}")
+            console.print()
+            return
+
+    if category == "connection":
         if not check_internet_connection(provider_name):
             get_error("no_internet").display()
         else:
             get_error("api_timeout").display()
     else:
-        console.print(f"\n[bold red]Error:[/bold red] {str(error)}")
-        console.print()
+        get_error(category).display()
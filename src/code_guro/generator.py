@@ -3,7 +3,12 @@
 Generates structured learning documentation from codebase analysis.
 """
 
+import bisect
+import functools
+import itertools
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List
 
@@ -43,6 +48,43 @@ _last_api_call_time = 0.0
 _last_call_input_tokens = 0
 _tokens_per_minute_limit = 30000  # Anthropic Build tier limit
 _min_delay_between_calls = 2.0  # Minimum 2 seconds between calls
+_rate_limit_lock = threading.Lock()  # Serializes the throttle window across worker threads
+
+# Indent strings by depth, so tree rendering indexes instead of
+# multiplying a new string per line
+_INDENTS = tuple("  " * depth for depth in range(16))
+
+# Top-level directories that never count as modules
+_MODULE_SKIP_DIRS = frozenset({"node_modules", "dist", "build", "public", "static", "assets"})
+
+# Sentinel for "not passed" where None is a legitimate value
+# (get_framework_context can return None)
+_UNSET = object()
+
+# Concurrent API calls during document generation. The prompts are
+# independent, so calls overlap on the network; kept low so a burst
+# stays within Anthropic's default requests-per-minute allowance.
+_MAX_CONCURRENT_CALLS = 4
+
+
+def _prewarm_api_connection() -> None:
+    """Open and discard a connection to the configured provider's API.
+
+    Run in a daemon thread before the first call_llm so DNS and the
+    TCP handshake are already cached by the OS when the real request
+    goes out. Failures are ignored; the real call will surface them.
+    """
+    import socket
+
+    from code_guro.config import get_provider_config
+    from code_guro.errors import API_ENDPOINTS
+
+    provider_name = (get_provider_config() or "anthropic").lower()
+    host_port = API_ENDPOINTS.get(provider_name, API_ENDPOINTS["anthropic"])
+    try:
+        socket.create_connection(host_port, timeout=3).close()
+    except OSError:
+        pass
 
 
 def create_output_dir(root: Path) -> Path:
@@ -69,29 +111,31 @@ def generate_file_tree(files: List[FileInfo], max_depth: int = 4) -> str:
     Returns:
         Text representation of file tree
     """
+    # Build a trie in one pass; inserting in sorted order means each
+    # node's children iterate in display order for free. This replaces
+    # the per-file prefix joins (O(files x depth) string hashing) and
+    # never renders lines past the output cap only to discard them.
+    tree: Dict[str, dict] = {}
+    for f in sorted(files, key=lambda f: f.relative_path):
+        node = tree
+        for part in f.parts:
+            node = node.setdefault(part, {})
+
+    # Pre-order DFS with an explicit stack, stopping at 100 lines.
+    # Internal nodes are directories, leaves are files.
     tree_lines = []
-    seen_dirs = set()
-
-    # Sort files by path
-    sorted_files = sorted(files, key=lambda f: f.relative_path)
-
-    for f in sorted_files:
-        parts = f.relative_path.split("/")
+    stack = [(name, child, 0) for name, child in reversed(tree.items())]
+    while stack and len(tree_lines) < 100:
+        name, child, depth = stack.pop()
+        indent = _INDENTS[depth] if depth < len(_INDENTS) else "  " * depth
+        if child:
+            if depth < max_depth:
+                tree_lines.append(f"{indent}{name}/")
+                stack.extend((n, c, depth + 1) for n, c in reversed(child.items()))
+        elif depth <= max_depth:
+            tree_lines.append(f"{indent}{name}")
 
-        # Add directory entries
-        for i in range(1, min(len(parts), max_depth + 1)):
-            dir_path = "/".join(parts[:i])
-            if dir_path not in seen_dirs and i < len(parts):
-                indent = "  " * (i - 1)
-                tree_lines.append(f"{indent}{parts[i-1]}/")
-                seen_dirs.add(dir_path)
-
-        # Add file entry (if within depth limit)
-        if len(parts) <= max_depth + 1:
-            indent = "  " * (len(parts) - 1)
-            tree_lines.append(f"{indent}{parts[-1]}")
-
-    return "\n".join(tree_lines[:100])  # Limit to 100 lines
+    return "\n".join(tree_lines)
 
 
 def format_file_content(files: List[FileInfo], max_tokens: int = 50000) -> str:
@@ -104,18 +148,28 @@ def format_file_content(files: List[FileInfo], max_tokens: int = 50000) -> str:
     Returns:
         Formatted file contents
     """
-    result = []
-    total_tokens = 0
-
-    for f in files:
-        if total_tokens + f.tokens > max_tokens:
-            break
-
-        result.append(f"## {f.relative_path}\n")
-        result.append(f"```{f.extension.lstrip('.')}\n{f.content}\n```\n\n")
-        total_tokens += f.tokens
-
-    return "\n".join(result)
+    # Find the cutoff from the precomputed FileInfo.tokens budget, then
+    # assemble flat fragments joined once. Each content string is
+    # referenced directly rather than copied into an interpolated piece
+    # first, which matters when the budget admits multi-MB files.
+    # Entries are exactly "## path\n```ext\n...\n```\n\n" — the old
+    # join-based assembly padded every entry with extra blank lines,
+    # which inflated the billed prompt tokens for no benefit.
+    cumulative = list(itertools.accumulate(f.tokens for f in files))
+    cutoff = bisect.bisect_right(cumulative, max_tokens)
+
+    parts = []
+    append = parts.append
+    for f in files[:cutoff]:
+        append("## ")
+        append(f.relative_path)
+        append("\n```")
+        append(f.extension.lstrip("."))
+        append("\n")
+        append(f.content)
+        append("\n```\n\n")
+
+    return "".join(parts)
 
 
 def call_llm(prompt: str, system: str = SYSTEM_PROMPT) -> str:
@@ -132,56 +186,56 @@ def call_llm(prompt: str, system: str = SYSTEM_PROMPT) -> str:
     """
     global _last_api_call_time, _last_call_input_tokens
 
-    # Intelligent rate limiting: Calculate delay based on previous token usage
-    if _last_api_call_time > 0 and _last_call_input_tokens > 0:
-        elapsed = time.time() - _last_api_call_time
-
-        # Calculate how long we should wait based on previous call's tokens
-        # If previous call used X tokens, we need to wait until those tokens "expire" from sliding window
-        # With 30k tokens/minute limit, tokens "expire" after 60 seconds
-        tokens_cleared_per_second = _tokens_per_minute_limit / 60.0  # 500 tokens/second
-
-        # How many tokens from previous call are still in the sliding window?
-        tokens_still_in_window = max(
-            0, _last_call_input_tokens - (elapsed * tokens_cleared_per_second)
-        )
-
-        # Estimate tokens for upcoming call
-        estimated_next_tokens = len(prompt + system) / 4  # Rough estimate: 4 chars per token
-
-        # Will this call exceed the limit?
-        if tokens_still_in_window + estimated_next_tokens > _tokens_per_minute_limit:
-            # Calculate additional delay needed
-            tokens_to_clear = (
-                tokens_still_in_window + estimated_next_tokens
-            ) - _tokens_per_minute_limit
-            additional_delay = tokens_to_clear / tokens_cleared_per_second
-            total_delay = max(_min_delay_between_calls - elapsed, additional_delay)
-
-            if total_delay > 0:
-                time.sleep(total_delay)
-        elif elapsed < _min_delay_between_calls:
-            # Fallback to minimum delay if we don't estimate exceeding limit
-            delay = _min_delay_between_calls - elapsed
-            time.sleep(delay)
-    elif _last_api_call_time > 0:
-        # First-time fallback: just ensure minimum delay
-        elapsed = time.time() - _last_api_call_time
-        if elapsed < _min_delay_between_calls:
-            time.sleep(_min_delay_between_calls - elapsed)
-
-    try:
-        provider = get_provider()
-        result = provider.call(prompt=prompt, system=system, max_tokens=4096)
+    # Intelligent rate limiting: Calculate delay based on previous token usage.
+    # The lock serializes the throttle window so concurrent workers stagger
+    # their dispatch times while their HTTP round-trips still overlap.
+    with _rate_limit_lock:
+        if _last_api_call_time > 0 and _last_call_input_tokens > 0:
+            elapsed = time.time() - _last_api_call_time
+
+            # Calculate how long we should wait based on previous call's tokens
+            # If previous call used X tokens, we need to wait until those tokens "expire" from sliding window
+            # With 30k tokens/minute limit, tokens "expire" after 60 seconds
+            tokens_cleared_per_second = _tokens_per_minute_limit / 60.0  # 500 tokens/second
+
+            # How many tokens from previous call are still in the sliding window?
+            tokens_still_in_window = max(
+                0, _last_call_input_tokens - (elapsed * tokens_cleared_per_second)
+            )
 
-        # Update tracking after successful call
+            # Estimate tokens for upcoming call
+            estimated_next_tokens = len(prompt + system) / 4  # Rough estimate: 4 chars per token
+
+            # Will this call exceed the limit?
+            if tokens_still_in_window + estimated_next_tokens > _tokens_per_minute_limit:
+                # Calculate additional delay needed
+                tokens_to_clear = (
+                    tokens_still_in_window + estimated_next_tokens
+                ) - _tokens_per_minute_limit
+                additional_delay = tokens_to_clear / tokens_cleared_per_second
+                total_delay = max(_min_delay_between_calls - elapsed, additional_delay)
+
+                if total_delay > 0:
+                    time.sleep(total_delay)
+            elif elapsed < _min_delay_between_calls:
+                # Fallback to minimum delay if we don't estimate exceeding limit
+                delay = _min_delay_between_calls - elapsed
+                time.sleep(delay)
+        elif _last_api_call_time > 0:
+            # First-time fallback: just ensure minimum delay
+            elapsed = time.time() - _last_api_call_time
+            if elapsed < _min_delay_between_calls:
+                time.sleep(_min_delay_between_calls - elapsed)
+
+        # Reserve the window before releasing the lock so the next caller
+        # throttles against this call rather than racing past it. Token
+        # count is estimated from char count (roughly 4 chars per token).
         _last_api_call_time = time.time()
-
-        # Try to get actual token count from provider (if available in result metadata)
-        # For now, estimate based on char count
         _last_call_input_tokens = int(len(prompt + system) / 4)
 
-        return result
+    try:
+        provider = get_provider()
+        return provider.call(prompt=prompt, system=system, max_tokens=4096)
     except ValueError:
         # Legacy fallback for tests/backwards compatibility
         api_key = get_api_key()
@@ -194,10 +248,6 @@ def call_llm(prompt: str, system: str = SYSTEM_PROMPT) -> str:
             messages=[{"role": "user", "content": prompt}],
         )
 
-        # Update tracking
-        _last_api_call_time = time.time()
-        _last_call_input_tokens = int(len(prompt + system) / 4)
-
         return message.content[0].text
 
 
@@ -224,11 +274,7 @@ def analyze_chunk(
         Analysis text for this chunk
     """
     # Get unique directories in this chunk
-    directories = set()
-    for f in chunk:
-        parts = f.relative_path.split("/")
-        if len(parts) > 1:
-            directories.add(parts[0])
+    directories = {f.top_dir for f in chunk if f.top_dir}
 
     framework_context = get_framework_context(frameworks) or "No specific framework detected"
 
@@ -406,13 +452,16 @@ def generate_chunked_documentation(
     # (these don't need full codebase context)
     console.print("[dim]Generating additional documentation...[/dim]")
 
-    orientation = generate_orientation(result)
+    framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
+    framework_context = get_framework_context(result.frameworks)
+
+    orientation = generate_orientation(result, framework_names=framework_names)
     (output_dir / "01-getting-oriented.md").write_text(orientation)
 
-    quality = generate_quality_analysis(result)
+    quality = generate_quality_analysis(result, framework_names=framework_names)
     (output_dir / "05-quality-analysis.md").write_text(quality)
 
-    next_steps = generate_next_steps(result)
+    next_steps = generate_next_steps(result, framework_names=framework_names)
     (output_dir / "06-next-steps.md").write_text(next_steps)
 
     # Generate deep dives for modules (section 04)
@@ -421,7 +470,7 @@ def generate_chunked_documentation(
     generated_deep_dives = []
 
     for module in modules:
-        content = generate_deep_dive(module, result)
+        content = generate_deep_dive(module, result, framework_context=framework_context)
         filename = f"04-deep-dive-{module['name'].lower().replace(' ', '-')}.md"
         filepath = output_dir / filename
         filepath.write_text(content)
@@ -454,7 +503,7 @@ separately, and then the results were synthesized into cohesive documentation.
 The following chunks were analyzed:
 """
     for i, chunk in enumerate(chunks, 1):
-        dirs = {f.relative_path.split("/")[0] for f in chunk if "/" in f.relative_path}
+        dirs = {f.top_dir for f in chunk if f.top_dir}
         note_content += f"\n### Chunk {i}\n- Files: {len(chunk)}\n- Directories: {', '.join(sorted(dirs)) or '(root)'}\n"
 
     (output_dir / "_analysis-notes.md").write_text(note_content)
@@ -476,39 +525,58 @@ The following chunks were analyzed:
 # ============================================================================
 
 
-def generate_overview(result: AnalysisResult) -> str:
+def generate_overview(
+    result: AnalysisResult,
+    *,
+    critical_files: List[FileInfo] = None,
+    framework_names: str = None,
+    file_tree: str = None,
+) -> str:
     """Generate the overview document.
 
     Args:
         result: Analysis result
+        critical_files: Precomputed top-10 critical files (optional)
+        framework_names: Precomputed framework names string (optional)
+        file_tree: Precomputed file tree text (optional)
 
     Returns:
         Generated markdown content
     """
-    critical_files = get_critical_files(result, limit=10)
-    framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
+    if critical_files is None:
+        critical_files = get_critical_files(result, limit=10)
+    if framework_names is None:
+        framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
+    if file_tree is None:
+        file_tree = generate_file_tree(result.files)
 
     prompt = OVERVIEW_PROMPT.format(
         root=result.root.name,
         file_count=len(result.files),
         frameworks=framework_names,
-        file_tree=generate_file_tree(result.files),
+        file_tree=file_tree,
         key_files=format_file_content(critical_files, max_tokens=30000),
     )
 
     return call_llm(prompt)
 
 
-def generate_orientation(result: AnalysisResult) -> str:
+def generate_orientation(
+    result: AnalysisResult,
+    *,
+    framework_names: str = None,
+) -> str:
     """Generate the getting oriented document.
 
     Args:
         result: Analysis result
+        framework_names: Precomputed framework names string (optional)
 
     Returns:
         Generated markdown content
     """
-    framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
+    if framework_names is None:
+        framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
 
     # Get a sample of diverse files
     sample_files = []
@@ -528,41 +596,66 @@ def generate_orientation(result: AnalysisResult) -> str:
     return call_llm(prompt)
 
 
-def generate_architecture(result: AnalysisResult) -> str:
+def generate_architecture(
+    result: AnalysisResult,
+    *,
+    critical_files: List[FileInfo] = None,
+    framework_names: str = None,
+    framework_context=_UNSET,
+    file_tree: str = None,
+) -> str:
     """Generate the architecture document.
 
     Args:
         result: Analysis result
+        critical_files: Precomputed top-15 critical files (optional)
+        framework_names: Precomputed framework names string (optional)
+        framework_context: Precomputed framework context (optional)
+        file_tree: Precomputed file tree text (optional)
 
     Returns:
         Generated markdown content
     """
-    critical_files = get_critical_files(result, limit=15)
-    framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
-    framework_context = get_framework_context(result.frameworks)
+    if critical_files is None:
+        critical_files = get_critical_files(result, limit=15)
+    if framework_names is None:
+        framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
+    if framework_context is _UNSET:
+        framework_context = get_framework_context(result.frameworks)
+    if file_tree is None:
+        file_tree = generate_file_tree(result.files)
 
     prompt = ARCHITECTURE_PROMPT.format(
         frameworks=framework_names,
         file_count=len(result.files),
         framework_context=framework_context or "No specific framework context available.",
         key_files=format_file_content(critical_files, max_tokens=40000),
-        file_tree=generate_file_tree(result.files),
+        file_tree=file_tree,
     )
 
     return call_llm(prompt)
 
 
-def generate_core_files(result: AnalysisResult) -> str:
+def generate_core_files(
+    result: AnalysisResult,
+    *,
+    critical_files: List[FileInfo] = None,
+    framework_names: str = None,
+) -> str:
     """Generate the core files document.
 
     Args:
         result: Analysis result
+        critical_files: Precomputed top-20 critical files (optional)
+        framework_names: Precomputed framework names string (optional)
 
     Returns:
         Generated markdown content
     """
-    critical_files = get_critical_files(result, limit=20)
-    framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
+    if critical_files is None:
+        critical_files = get_critical_files(result, limit=20)
+    if framework_names is None:
+        framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
 
     prompt = CORE_FILES_PROMPT.format(
         frameworks=framework_names,
@@ -582,19 +675,19 @@ def identify_modules(result: AnalysisResult) -> List[Dict]:
     Returns:
         List of module info dicts
     """
-    # Group files by top-level directories
+    # A module needs 3+ files, so repos smaller than that can't have one
+    if len(result.files) < 3:
+        return []
+
+    # Group files by the precomputed top-level directory; the skip
+    # check is a frozenset lookup.
     dir_groups: Dict[str, List[FileInfo]] = {}
 
     for f in result.files:
-        parts = f.relative_path.split("/")
-        if len(parts) > 1:
-            top_dir = parts[0]
-            # Skip common non-module directories
-            if top_dir in ("node_modules", "dist", "build", "public", "static", "assets"):
-                continue
-            if top_dir not in dir_groups:
-                dir_groups[top_dir] = []
-            dir_groups[top_dir].append(f)
+        top_dir = f.top_dir
+        if not top_dir or top_dir in _MODULE_SKIP_DIRS:
+            continue
+        dir_groups.setdefault(top_dir, []).append(f)
 
     # Create module info for significant directories
     modules = []
@@ -618,17 +711,19 @@ def identify_modules(result: AnalysisResult) -> List[Dict]:
     return modules[:5]
 
 
-def generate_deep_dive(module: Dict, result: AnalysisResult) -> str:
+def generate_deep_dive(module: Dict, result: AnalysisResult, *, framework_context=_UNSET) -> str:
     """Generate a deep dive document for a module.
 
     Args:
         module: Module info dict
         result: Analysis result
+        framework_context: Precomputed framework context (optional)
 
     Returns:
         Generated markdown content
     """
-    framework_context = get_framework_context(result.frameworks)
+    if framework_context is _UNSET:
+        framework_context = get_framework_context(result.frameworks)
 
     prompt = DEEP_DIVE_PROMPT.format(
         module_name=module["name"],
@@ -640,25 +735,37 @@ def generate_deep_dive(module: Dict, result: AnalysisResult) -> str:
     return call_llm(prompt)
 
 
-def generate_quality_analysis(result: AnalysisResult) -> str:
+def generate_quality_analysis(
+    result: AnalysisResult,
+    *,
+    sample_files: List[FileInfo] = None,
+    framework_names: str = None,
+) -> str:
     """Generate the quality analysis document.
 
     Args:
         result: Analysis result
+        sample_files: Precomputed top-10 critical files (optional)
+        framework_names: Precomputed framework names string (optional)
 
     Returns:
         Generated markdown content
     """
-    framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
+    if framework_names is None:
+        framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
 
-    # Get test count
-    test_count = sum(1 for f in result.files if f.is_test)
-
-    # Get config files
-    config_files = [f for f in result.files if f.is_config]
+    # Count tests and collect config files in one pass over the files
+    test_count = 0
+    config_files = []
+    for f in result.files:
+        if f.is_test:
+            test_count += 1
+        if f.is_config:
+            config_files.append(f)
 
     # Get a sample of code
-    sample_files = get_critical_files(result, limit=10)
+    if sample_files is None:
+        sample_files = get_critical_files(result, limit=10)
 
     prompt = QUALITY_PROMPT.format(
         frameworks=framework_names,
@@ -671,17 +778,26 @@ def generate_quality_analysis(result: AnalysisResult) -> str:
     return call_llm(prompt)
 
 
-def generate_next_steps(result: AnalysisResult) -> str:
+def generate_next_steps(
+    result: AnalysisResult,
+    *,
+    modules: List[Dict] = None,
+    framework_names: str = None,
+) -> str:
     """Generate the next steps document.
 
     Args:
         result: Analysis result
+        modules: Precomputed identify_modules output (optional)
+        framework_names: Precomputed framework names string (optional)
 
     Returns:
         Generated markdown content
     """
-    framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
-    modules = identify_modules(result)
+    if framework_names is None:
+        framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
+    if modules is None:
+        modules = identify_modules(result)
     module_names = ", ".join(m["name"] for m in modules) or "No clear modules identified"
 
     prompt = NEXT_STEPS_PROMPT.format(
@@ -707,6 +823,10 @@ def generate_documentation(
     """
     output_dir = create_output_dir(result.root)
 
+    # Warm up DNS and the TCP handshake while output setup runs so the
+    # first API call doesn't pay full connection-establishment cost
+    threading.Thread(target=_prewarm_api_connection, daemon=True).start()
+
     # Determine target directory for markdown files
     if markdown_only:
         markdown_dir = output_dir
@@ -718,14 +838,70 @@ def generate_documentation(
     if result.needs_chunking:
         generate_chunked_documentation(result, markdown_dir)
     else:
-        # Standard (non-chunked) generation
+        # Standard (non-chunked) generation. The generators share several
+        # derived inputs, so compute each once here rather than per
+        # document; get_critical_files returns a sorted list, so the
+        # smaller selections are free slices of the top 20.
+        framework_names = ", ".join(f.name for f in result.frameworks) or "None detected"
+        framework_context = get_framework_context(result.frameworks)
+        critical_files = get_critical_files(result, limit=20)
+        file_tree = generate_file_tree(result.files)
+        modules = identify_modules(result)
+
         documents = [
-            ("00-overview.md", "Generating overview...", generate_overview),
-            ("01-getting-oriented.md", "Generating orientation guide...", generate_orientation),
-            ("02-architecture.md", "Generating architecture analysis...", generate_architecture),
-            ("03-core-files.md", "Generating core files guide...", generate_core_files),
-            ("05-quality-analysis.md", "Generating quality analysis...", generate_quality_analysis),
-            ("06-next-steps.md", "Generating next steps...", generate_next_steps),
+            (
+                "00-overview.md",
+                "Generating overview...",
+                functools.partial(
+                    generate_overview,
+                    critical_files=critical_files[:10],
+                    framework_names=framework_names,
+                    file_tree=file_tree,
+                ),
+            ),
+            (
+                "01-getting-oriented.md",
+                "Generating orientation guide...",
+                functools.partial(generate_orientation, framework_names=framework_names),
+            ),
+            (
+                "02-architecture.md",
+                "Generating architecture analysis...",
+                functools.partial(
+                    generate_architecture,
+                    critical_files=critical_files[:15],
+                    framework_names=framework_names,
+                    framework_context=framework_context,
+                    file_tree=file_tree,
+                ),
+            ),
+            (
+                "03-core-files.md",
+                "Generating core files guide...",
+                functools.partial(
+                    generate_core_files,
+                    critical_files=critical_files,
+                    framework_names=framework_names,
+                ),
+            ),
+            (
+                "05-quality-analysis.md",
+                "Generating quality analysis...",
+                functools.partial(
+                    generate_quality_analysis,
+                    sample_files=critical_files[:10],
+                    framework_names=framework_names,
+                ),
+            ),
+            (
+                "06-next-steps.md",
+                "Generating next steps...",
+                functools.partial(
+                    generate_next_steps,
+                    modules=modules,
+                    framework_names=framework_names,
+                ),
+            ),
         ]
 
         with Progress(
@@ -735,27 +911,42 @@ def generate_documentation(
             TaskProgressColumn(),
             console=console,
         ) as progress:
-            task = progress.add_task("", total=len(documents) + 1)
-
-            # Generate main documents
-            for _idx, (filename, description, generator) in enumerate(documents):
-                progress.update(task, description=description)
-                content = generator(result)
-
-                filepath = markdown_dir / filename
-                filepath.write_text(content)
-                progress.advance(task)
-
-            # Generate deep dives for modules
-            progress.update(task, description="Generating module deep dives...")
-            modules = identify_modules(result)
-
-            for module in modules:
-                content = generate_deep_dive(module, result)
-                filename = f"04-deep-dive-{module['name'].lower().replace(' ', '-')}.md"
-                filepath = markdown_dir / filename
-                filepath.write_text(content)
-
+            task = progress.add_task("Generating documentation...", total=len(documents) + 1)
+
+            # The prompts are independent, so the calls run concurrently
+            # and wallclock tracks the slowest response instead of the
+            # sum; call_llm's throttle still staggers dispatch to stay
+            # inside the rate limit.
+            with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_CALLS) as executor:
+                futures = {
+                    executor.submit(generator, result): filename
+                    for filename, description, generator in documents
+                }
+                deep_dive_futures = set()
+                for module in modules:
+                    filename = f"04-deep-dive-{module['name'].lower().replace(' ', '-')}.md"
+                    future = executor.submit(
+                        generate_deep_dive, module, result, framework_context=framework_context
+                    )
+                    futures[future] = filename
+                    deep_dive_futures.add(future)
+
+                try:
+                    # Pop each future as it completes so the finished
+                    # response string is released right after the write
+                    # instead of living in the futures table until the
+                    # pool closes
+                    for future in as_completed(list(futures)):
+                        filepath = markdown_dir / futures.pop(future)
+                        filepath.write_text(future.result())
+                        if future not in deep_dive_futures:
+                            progress.advance(task)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+            # Deep dives share the final progress step, as before
             progress.advance(task)
             progress.update(task, description="Documentation generation complete")
 
@@ -3,8 +3,9 @@
 Supports multiple LLM providers: Anthropic Claude, OpenAI GPT-4o, and Google Gemini.
 """
 
+import os
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 __all__ = ["LLMProvider"]
 
@@ -52,6 +53,31 @@ class LLMProvider(ABC):
         """
         pass
 
+    def call_stream(
+        self,
+        prompt: str,
+        system: str = "",
+        max_tokens: int = 4096,
+    ) -> Iterator[str]:
+        """Make a call to the LLM API, yielding response text as it arrives.
+
+        The default implementation yields the blocking call's result in
+        one piece; providers override this to stream incrementally so
+        interactive callers can render text at first-token latency.
+
+        Args:
+            prompt: The user prompt
+            system: The system prompt
+            max_tokens: Maximum tokens in response
+
+        Yields:
+            Chunks of the LLM response text, in order
+
+        Raises:
+            Various provider-specific exceptions for API errors
+        """
+        yield self.call(prompt, system=system, max_tokens=max_tokens)
+
     @abstractmethod
     def validate_api_key(self, api_key: Optional[str] = None) -> Tuple[bool, str]:
         """Validate an API key by making a test request.
@@ -89,6 +115,26 @@ class LLMProvider(ABC):
         """
         pass
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for many text strings at once.
+
+        All current providers count with the shared tiktoken encoding,
+        and tiktoken's encode_batch fans the work out across threads
+        (the encoder releases the GIL), so batching is much faster than
+        calling count_tokens in a loop when scanning a codebase.
+
+        Args:
+            texts: The text strings to count tokens for
+
+        Returns:
+            Number of tokens for each text, in input order
+        """
+        from code_guro.utils import get_encoding
+
+        encoding = get_encoding()
+        num_threads = os.cpu_count() or 4
+        return [len(tokens) for tokens in encoding.encode_batch(texts, num_threads=num_threads)]
+
     @abstractmethod
     def get_api_key_env_var(self) -> str:
         """Get the environment variable name for this provider's API key.
@@ -1,13 +1,69 @@
 """Anthropic Claude provider implementation."""
 
+import functools
 import os
+import random
 import time
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 
 import anthropic
-import tiktoken
 
 from code_guro.providers import LLMProvider
+from code_guro.utils import get_encoding
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client(api_key: str) -> anthropic.Anthropic:
+    """Return a shared client for the given API key.
+
+    Every anthropic.Anthropic constructs its own httpx client, which
+    pays DNS + TCP + TLS setup on its first request. Reusing one keeps
+    the connection pool's keep-alive sockets warm across the several
+    calls of a documentation run. The client is thread-safe, so the
+    concurrent generation workers can share it.
+    """
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def _retry_delay(error: Exception, attempt: int, base_delay: float) -> float:
+    """Compute the sleep before a retry attempt.
+
+    Honors the server's Retry-After hint when present (never sleeping
+    less than it asks) and adds jitter so concurrent workers that were
+    rate-limited together don't retry in lockstep and re-collide.
+
+    Args:
+        error: The API error that triggered the retry
+        attempt: Zero-based retry attempt number
+        base_delay: Base backoff delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    delay = base_delay * (2**attempt)
+
+    response = getattr(error, "response", None)
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+
+    return delay + random.uniform(0, base_delay)
+
+
+def _build_system_param(system: str):
+    """Wrap a system prompt as a cacheable content block.
+
+    The cache_control marker lets the server reuse the processed prefix
+    across calls that share the same system prompt; below the caching
+    minimum (~1k tokens) it is simply ignored.
+    """
+    if not system:
+        return system
+    return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
 
 
 class AnthropicProvider(LLMProvider):
@@ -17,10 +73,6 @@ class AnthropicProvider(LLMProvider):
     INPUT_COST_PER_MILLION = 3.0  # $3 per million input tokens
     OUTPUT_COST_PER_MILLION = 15.0  # $15 per million output tokens
 
-    def __init__(self):
-        """Initialize Anthropic provider."""
-        self._encoding = None
-
     def get_model_name(self) -> str:
         """Get the default model name for Anthropic.
 
@@ -86,7 +138,13 @@ class AnthropicProvider(LLMProvider):
                 "Anthropic API key not configured. Set ANTHROPIC_API_KEY environment variable."
             )
 
-        client = anthropic.Anthropic(api_key=api_key)
+        client = _get_client(api_key)
+
+        # Marked for prompt caching: the server reuses the processed
+        # prefix across this run's calls, which all share the same
+        # system prompt, and bills cached reads at a fraction of the
+        # prefill cost
+        system_param = _build_system_param(system)
 
         # Retry configuration
         max_retries = 3
@@ -94,25 +152,133 @@ class AnthropicProvider(LLMProvider):
 
         for attempt in range(max_retries + 1):
             try:
-                message = client.messages.create(
-                    model=self.MODEL,
-                    max_tokens=max_tokens,
-                    system=system,
-                    messages=[{"role": "user", "content": prompt}],
-                )
-
-                return message.content[0].text
-
-            except anthropic.RateLimitError:
+                # Stream the response rather than blocking until the
+                # server assembles all max_tokens; text accumulates as
+                # it is generated, so long completions don't sit
+                # fully-buffered server-side before we see a byte
+                try:
+                    chunks = []
+                    with client.messages.stream(
+                        model=self.MODEL,
+                        max_tokens=max_tokens,
+                        system=system_param,
+                        messages=[{"role": "user", "content": prompt}],
+                    ) as stream:
+                        for text in stream.text_stream:
+                            chunks.append(text)
+
+                    return "".join(chunks)
+                except TypeError:
+                    # Legacy fallback for clients without streaming
+                    # support (e.g. test doubles that only implement
+                    # messages.create). Only valid if no text arrived:
+                    # a mid-stream TypeError must not silently re-issue
+                    # (and re-bill) the whole request
+                    if chunks:
+                        raise
+                    message = client.messages.create(
+                        model=self.MODEL,
+                        max_tokens=max_tokens,
+                        system=system_param,
+                        messages=[{"role": "user", "content": prompt}],
+                    )
+                    return message.content[0].text
+
+            except anthropic.RateLimitError as e:
                 # If this was the last attempt, re-raise the error
                 if attempt >= max_retries:
                     raise
 
-                # Calculate exponential backoff delay
-                delay = base_delay * (2**attempt)
+                time.sleep(_retry_delay(e, attempt, base_delay))
+
+            except anthropic.APIStatusError as e:
+                # 529 means the API is temporarily overloaded; treat it
+                # like a rate limit and retry
+                if e.status_code != 529 or attempt >= max_retries:
+                    raise
+
+                time.sleep(_retry_delay(e, attempt, base_delay))
+
+    def call_stream(
+        self,
+        prompt: str,
+        system: str = "",
+        max_tokens: int = 4096,
+    ) -> Iterator[str]:
+        """Stream a Claude response, yielding text chunks as they arrive.
+
+        Args:
+            prompt: The user prompt
+            system: The system prompt
+            max_tokens: Maximum tokens in response
+
+        Yields:
+            Chunks of Claude's response text, in order
+
+        Raises:
+            anthropic.AuthenticationError: If API key is invalid
+            anthropic.RateLimitError: If rate limited after all retries
+            anthropic.APIConnectionError: If connection fails
+        """
+        api_key = self.get_api_key()
+        if not api_key:
+            raise ValueError(
+                "Anthropic API key not configured. Set ANTHROPIC_API_KEY environment variable."
+            )
+
+        client = _get_client(api_key)
+        system_param = _build_system_param(system)
+
+        # Retry configuration
+        max_retries = 3
+        base_delay = 5  # Start with 5 seconds
+
+        for attempt in range(max_retries + 1):
+            # Once text has reached the caller a retry would duplicate
+            # it, so mid-stream failures are re-raised instead
+            yielded = False
+            try:
+                try:
+                    with client.messages.stream(
+                        model=self.MODEL,
+                        max_tokens=max_tokens,
+                        system=system_param,
+                        messages=[{"role": "user", "content": prompt}],
+                    ) as stream:
+                        for text in stream.text_stream:
+                            yielded = True
+                            yield text
+                    return
+                except TypeError:
+                    # Legacy fallback for clients without streaming
+                    # support (e.g. test doubles that only implement
+                    # messages.create). Only valid if no text arrived:
+                    # a mid-stream TypeError must not silently re-issue
+                    # (and re-bill) the whole request
+                    if yielded:
+                        raise
+                    message = client.messages.create(
+                        model=self.MODEL,
+                        max_tokens=max_tokens,
+                        system=system_param,
+                        messages=[{"role": "user", "content": prompt}],
+                    )
+                    yield message.content[0].text
+                    return
+
+            except anthropic.RateLimitError as e:
+                if yielded or attempt >= max_retries:
+                    raise
+
+                time.sleep(_retry_delay(e, attempt, base_delay))
+
+            except anthropic.APIStatusError as e:
+                # 529 means the API is temporarily overloaded; treat it
+                # like a rate limit and retry
+                if yielded or e.status_code != 529 or attempt >= max_retries:
+                    raise
 
-                # Wait before retrying
-                time.sleep(delay)
+                time.sleep(_retry_delay(e, attempt, base_delay))
 
     def validate_api_key(self, api_key: Optional[str] = None) -> Tuple[bool, str]:
         """Validate an Anthropic API key by making a test request.
@@ -172,10 +338,7 @@ class AnthropicProvider(LLMProvider):
         Returns:
             Number of tokens
         """
-        if self._encoding is None:
-            # Claude uses cl100k_base encoding (same as GPT-4)
-            self._encoding = tiktoken.get_encoding("cl100k_base")
-        return len(self._encoding.encode(text))
+        return len(get_encoding().encode(text))
 
     def get_api_key_env_var(self) -> str:
         """Get the environment variable name for Anthropic API key.
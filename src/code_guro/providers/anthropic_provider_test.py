@@ -0,0 +1,89 @@
+"""Tests for the Anthropic provider's streaming call path."""
+
+from unittest.mock import Mock
+
+import anthropic
+import pytest
+
+from code_guro.providers import anthropic_provider
+
+
+class _FakeStream:
+    """Minimal stand-in for the SDK's streaming context manager."""
+
+    def __init__(self, text_stream):
+        self.text_stream = text_stream
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+def _make_provider(monkeypatch, client):
+    """Build a provider wired to the given fake client."""
+    monkeypatch.setattr(anthropic_provider, "_get_client", lambda api_key: client)
+    provider = anthropic_provider.AnthropicProvider()
+    monkeypatch.setattr(provider, "get_api_key", lambda: "test-key")
+    return provider
+
+
+class TestCallStream:
+    """Tests for call_stream's chunk delivery and retry contract."""
+
+    def test_yields_chunks_in_order(self, monkeypatch):
+        """Streamed text should be yielded chunk by chunk."""
+        client = Mock()
+        client.messages.stream.return_value = _FakeStream(iter(["a", "b", "c"]))
+        provider = _make_provider(monkeypatch, client)
+
+        assert list(provider.call_stream("hi")) == ["a", "b", "c"]
+        assert client.messages.create.call_count == 0
+
+    def test_no_retry_after_first_chunk(self, monkeypatch):
+        """A failure after text has been yielded must not re-issue the request."""
+
+        def failing_stream():
+            yield "partial"
+            raise anthropic.RateLimitError.__new__(anthropic.RateLimitError)
+
+        client = Mock()
+        client.messages.stream.return_value = _FakeStream(failing_stream())
+        provider = _make_provider(monkeypatch, client)
+
+        received = []
+        with pytest.raises(anthropic.RateLimitError):
+            for chunk in provider.call_stream("hi"):
+                received.append(chunk)
+
+        assert received == ["partial"]
+        # Exactly one request: no retry, no messages.create fallback
+        assert client.messages.stream.call_count == 1
+        assert client.messages.create.call_count == 0
+
+    def test_mid_stream_type_error_not_swallowed(self, monkeypatch):
+        """A TypeError mid-stream must not trigger the legacy fallback."""
+
+        def failing_stream():
+            yield "partial"
+            raise TypeError("boom")
+
+        client = Mock()
+        client.messages.stream.return_value = _FakeStream(failing_stream())
+        provider = _make_provider(monkeypatch, client)
+
+        with pytest.raises(TypeError):
+            list(provider.call_stream("hi"))
+
+        assert client.messages.create.call_count == 0
+
+    def test_falls_back_to_create_without_streaming(self, monkeypatch):
+        """Clients without streaming support should get one create call."""
+        client = Mock()
+        # Mock's messages.stream result is not a context manager -> TypeError
+        client.messages.create.return_value.content = [Mock(text="full answer")]
+        provider = _make_provider(monkeypatch, client)
+
+        assert list(provider.call_stream("hi")) == ["full answer"]
+        assert client.messages.create.call_count == 1
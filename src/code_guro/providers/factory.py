@@ -1,27 +1,45 @@
 """Provider factory for creating LLM provider instances."""
 
+import functools
+import importlib
 import importlib.util
 from typing import Optional
 
+# Static lookup of provider id -> (module, class name). Only the
+# selected provider's module — and its SDK — is ever imported, so
+# configuring one provider never pays for the others.
+_PROVIDER_SPECS = {
+    "anthropic": ("code_guro.providers.anthropic_provider", "AnthropicProvider"),
+    "openai": ("code_guro.providers.openai_provider", "OpenAIProvider"),
+    "google": ("code_guro.providers.gemini_provider", "GeminiProvider"),
+}
 
+# Resolved provider classes, filled in on first use
+_provider_class_cache = {}
+
+
+@functools.lru_cache(maxsize=1)
 def _google_sdk_available() -> bool:
     """Check if the Google Generative AI SDK is available."""
     return importlib.util.find_spec("google.generativeai") is not None
 
 
-def _get_provider_registry():
-    """Lazy import providers to avoid circular dependencies."""
-    from code_guro.providers.anthropic_provider import AnthropicProvider
-    from code_guro.providers.openai_provider import OpenAIProvider
-
-    registry = {"anthropic": AnthropicProvider, "openai": OpenAIProvider}
-
-    if _google_sdk_available():
-        from code_guro.providers.gemini_provider import GeminiProvider
+def _resolve_provider_class(provider_name: str):
+    """Import and cache the class for a single provider id."""
+    cls = _provider_class_cache.get(provider_name)
+    if cls is None:
+        module_name, class_name = _PROVIDER_SPECS[provider_name]
+        cls = getattr(importlib.import_module(module_name), class_name)
+        _provider_class_cache[provider_name] = cls
+    return cls
 
-        registry["google"] = GeminiProvider
 
-    return registry
+def __getattr__(name):
+    """Lazily expose the provider classes as module attributes."""
+    for provider_name, (_, class_name) in _PROVIDER_SPECS.items():
+        if name == class_name:
+            return _resolve_provider_class(provider_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_provider(provider_name: Optional[str] = None):
@@ -44,19 +62,24 @@ def get_provider(provider_name: Optional[str] = None):
     if not provider_name:
         raise ValueError("No provider configured. Run 'code-guro configure' to set up a provider.")
 
-    provider_name = provider_name.lower()
-    providers = _get_provider_registry()
+    # Config and the CLI already hand over lowercase names, so the
+    # common case skips the .lower() allocation
+    if not provider_name.islower():
+        provider_name = provider_name.lower()
 
-    if provider_name not in providers:
-        if provider_name == "google" and not _google_sdk_available():
+    if provider_name not in _PROVIDER_SPECS or (
+        provider_name == "google" and not _google_sdk_available()
+    ):
+        if provider_name == "google":
             raise ValueError(
                 "Google provider requires google-generativeai. "
                 "Install it with Python 3.9+ to enable Gemini support."
             )
-        valid_providers = ", ".join(providers.keys())
-        raise ValueError(f"Invalid provider '{provider_name}'. Valid providers: {valid_providers}")
+        raise ValueError(
+            f"Invalid provider '{provider_name}'. Valid providers: {', '.join(list_providers())}"
+        )
 
-    provider_class = providers[provider_name]
+    provider_class = _resolve_provider_class(provider_name)
     return provider_class()
 
 
@@ -66,4 +89,42 @@ def list_providers():
     Returns:
         List of provider names
     """
-    return list(_get_provider_registry().keys())
+    return [name for name in _PROVIDER_SPECS if name != "google" or _google_sdk_available()]
+
+
+# Static display metadata for the configure flow, keyed by provider id.
+# Kept here (not on the provider classes) so listing it never instantiates
+# or imports a provider SDK.
+_PROVIDER_METADATA = {
+    "anthropic": (
+        "Anthropic Claude (Claude Sonnet 4)",
+        "Code understanding and documentation",
+        "$3/$15 per million tokens (input/output)",
+        "https://console.anthropic.com",
+    ),
+    "openai": (
+        "OpenAI (GPT-4o)",
+        "General-purpose code analysis",
+        "$2.50/$10 per million tokens (input/output)",
+        "https://platform.openai.com",
+    ),
+    "google": (
+        "Google Gemini (Gemini 2.0 Flash)",
+        "Cost-effective analysis",
+        "$0.075/$0.30 per million tokens (input/output)",
+        "https://aistudio.google.com",
+    ),
+}
+
+
+def list_provider_metadata():
+    """List display metadata for the available providers.
+
+    Returns:
+        List of (provider_id, name, best_for, cost, url) tuples
+    """
+    return [
+        (provider_id,) + _PROVIDER_METADATA[provider_id]
+        for provider_id in list_providers()
+        if provider_id in _PROVIDER_METADATA
+    ]
@@ -1,17 +1,55 @@
 """Google Gemini provider implementation."""
 
+import functools
 import os
 import time
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 
-try:
+from code_guro.providers import LLMProvider
+from code_guro.utils import get_encoding
+
+
+@functools.lru_cache(maxsize=1)
+def _import_genai():
+    """Import google.generativeai on first use.
+
+    The SDK is an optional dependency with a heavy import (its proto
+    stack alone takes noticeable time), and the factory already gates
+    provider availability with a find_spec check — so this module
+    defers the real import until a method actually needs it.
+
+    Raises:
+        ImportError: If google-generativeai is not installed
+    """
     import google.generativeai as genai
-except ImportError:  # pragma: no cover - handled at runtime for optional dependency
-    genai = None
 
-import tiktoken
+    return genai
 
-from code_guro.providers import LLMProvider
+
+@functools.lru_cache(maxsize=4)
+def _get_model(model_name: str, system_instruction: Optional[str]):
+    """Return a shared GenerativeModel for a (model, system prompt) pair.
+
+    A documentation run and the REPL reuse the same handful of system
+    prompts, so caching avoids rebuilding the model wrapper on every
+    call. Must only be called after genai.configure has run.
+    """
+    genai = _import_genai()
+    return genai.GenerativeModel(
+        model_name=model_name,
+        system_instruction=system_instruction,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_generation_config(max_tokens: int):
+    """Return a shared GenerationConfig for a max_tokens value.
+
+    Calls in a run use a small set of limits, so the config objects
+    are reused rather than rebuilt per call.
+    """
+    genai = _import_genai()
+    return genai.types.GenerationConfig(max_output_tokens=max_tokens)
 
 
 class GeminiProvider(LLMProvider):
@@ -23,16 +61,18 @@ class GeminiProvider(LLMProvider):
 
     def __init__(self):
         """Initialize Gemini provider."""
-        self._encoding = None
         self._client_initialized = False
+        self._cached_api_key: Optional[str] = None
 
     def _ensure_client_initialized(self):
         """Ensure the Gemini client is initialized with API key."""
-        if genai is None:
+        try:
+            genai = _import_genai()
+        except ImportError:
             raise ImportError(
                 "google-generativeai is not installed. "
                 "Install it with Python 3.9+ to use the Google provider."
-            )
+            ) from None
         if not self._client_initialized:
             api_key = self.get_api_key()
             if not api_key:
@@ -61,21 +101,27 @@ class GeminiProvider(LLMProvider):
         Returns:
             API key string or None if not configured
         """
+        # Every call re-reads the config file and environment, and
+        # _ensure_client_initialized triggers this on each REPL turn,
+        # so a found key is cached on the instance
+        if self._cached_api_key:
+            return self._cached_api_key
+
         # Check config file first
         from code_guro.config import get_api_key_from_config
 
-        config_key = get_api_key_from_config("google")
-        if config_key:
-            return config_key
+        key = get_api_key_from_config("google")
 
-        # Check GOOGLE_API_KEY (standard)
-        key = os.environ.get("GOOGLE_API_KEY")
-        if key:
-            return key
+        if not key:
+            # Check GOOGLE_API_KEY (standard), then GEMINI_API_KEY for
+            # backwards compatibility
+            for env_var in ("GOOGLE_API_KEY", "GEMINI_API_KEY"):
+                key = os.environ.get(env_var)
+                if key:
+                    break
 
-        # Check GEMINI_API_KEY for backwards compatibility
-        key = os.environ.get("GEMINI_API_KEY")
         if key:
+            self._cached_api_key = key
             return key
 
         return None
@@ -101,13 +147,10 @@ class GeminiProvider(LLMProvider):
         """
         self._ensure_client_initialized()
 
-        model = genai.GenerativeModel(
-            model_name=self.MODEL,
-            system_instruction=system if system else None,
-        )
+        model = _get_model(self.MODEL, system if system else None)
 
-        # Gemini uses generation_config for max_tokens
-        generation_config = genai.types.GenerationConfig(max_output_tokens=max_tokens)
+        # Gemini uses generation_config for max_tokens (shared per limit)
+        generation_config = _get_generation_config(max_tokens)
 
         # Retry configuration
         max_retries = 3
@@ -149,6 +192,69 @@ class GeminiProvider(LLMProvider):
                     # Not a rate limit error, raise immediately
                     raise
 
+    def call_stream(
+        self,
+        prompt: str,
+        system: str = "",
+        max_tokens: int = 4096,
+    ) -> Iterator[str]:
+        """Stream a Gemini response, yielding text chunks as they arrive.
+
+        Args:
+            prompt: The user prompt
+            system: The system prompt (Gemini uses system_instruction parameter)
+            max_tokens: Maximum tokens in response
+
+        Yields:
+            Chunks of Gemini's response text, in order
+
+        Raises:
+            Exception: Various exceptions for API errors after all retries
+        """
+        self._ensure_client_initialized()
+
+        model = _get_model(self.MODEL, system if system else None)
+
+        # Gemini uses generation_config for max_tokens (shared per limit)
+        generation_config = _get_generation_config(max_tokens)
+
+        # Retry configuration
+        max_retries = 3
+        base_delay = 5  # Start with 5 seconds
+
+        for attempt in range(max_retries + 1):
+            # Once text has reached the caller a retry would duplicate
+            # it, so mid-stream failures are re-raised instead
+            yielded = False
+            try:
+                response = model.generate_content(
+                    prompt, generation_config=generation_config, stream=True
+                )
+
+                for chunk in response:
+                    if chunk.text:
+                        yielded = True
+                        yield chunk.text
+                return
+
+            except Exception as e:
+                error_str = str(e).lower()
+                is_rate_limit = (
+                    "rate" in error_str
+                    or "quota" in error_str
+                    or "429" in error_str
+                    or "resource_exhausted" in error_str
+                )
+
+                if not is_rate_limit or yielded or attempt >= max_retries:
+                    raise
+
+                # Calculate exponential backoff delay
+                delay = base_delay * (2**attempt)
+
+                # Wait before retrying
+                time.sleep(delay)
+
     def validate_api_key(self, api_key: Optional[str] = None) -> Tuple[bool, str]:
         """Validate a Google API key by making a test request.
 
@@ -158,13 +264,19 @@ class GeminiProvider(LLMProvider):
         Returns:
             Tuple of (is_valid, message)
         """
+        # Validation runs during (re)configuration, so drop the cached
+        # key and re-read whatever is configured now
+        self._cached_api_key = None
+
         if api_key is None:
             api_key = self.get_api_key()
 
         if not api_key:
             return False, "No API key found. Set GOOGLE_API_KEY environment variable."
 
-        if genai is None:
+        try:
+            genai = _import_genai()
+        except ImportError:
             return (
                 False,
                 "google-generativeai is not installed. Install it with Python 3.9+ to use Gemini.",
@@ -222,9 +334,7 @@ class GeminiProvider(LLMProvider):
             Number of tokens (approximate)
         """
         # Use tiktoken as approximation - Gemini tokenization is similar
-        if self._encoding is None:
-            self._encoding = tiktoken.get_encoding("cl100k_base")
-        return len(self._encoding.encode(text))
+        return len(get_encoding().encode(text))
 
     def get_api_key_env_var(self) -> str:
         """Get the environment variable name for Google API key.
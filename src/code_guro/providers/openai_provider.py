@@ -1,13 +1,26 @@
 """OpenAI GPT-4o provider implementation."""
 
+import functools
 import os
 import time
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 
 import openai
-import tiktoken
 
 from code_guro.providers import LLMProvider
+from code_guro.utils import get_encoding
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client(api_key: str) -> openai.OpenAI:
+    """Return a shared client for the given API key.
+
+    openai.OpenAI builds an httpx client (SSL context, connection pool)
+    on construction, so creating one per call pays that setup on every
+    REPL question. Sharing one also keeps HTTP keep-alive connections
+    open across calls; the client is thread-safe.
+    """
+    return openai.OpenAI(api_key=api_key)
 
 
 class OpenAIProvider(LLMProvider):
@@ -17,10 +30,6 @@ class OpenAIProvider(LLMProvider):
     INPUT_COST_PER_MILLION = 2.50  # $2.50 per million input tokens
     OUTPUT_COST_PER_MILLION = 10.0  # $10 per million output tokens
 
-    def __init__(self):
-        """Initialize OpenAI provider."""
-        self._encoding = None
-
     def get_model_name(self) -> str:
         """Get the default model name for OpenAI.
 
@@ -76,7 +85,7 @@ class OpenAIProvider(LLMProvider):
                 "OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
             )
 
-        client = openai.OpenAI(api_key=api_key)
+        client = _get_client(api_key)
 
         # Build messages list
         messages = []
@@ -109,6 +118,77 @@ class OpenAIProvider(LLMProvider):
                 # Wait before retrying
                 time.sleep(delay)
 
+    def call_stream(
+        self,
+        prompt: str,
+        system: str = "",
+        max_tokens: int = 4096,
+    ) -> Iterator[str]:
+        """Stream an OpenAI response, yielding text chunks as they arrive.
+
+        Args:
+            prompt: The user prompt
+            system: The system prompt
+            max_tokens: Maximum tokens in response
+
+        Yields:
+            Chunks of OpenAI's response text, in order
+
+        Raises:
+            openai.AuthenticationError: If API key is invalid
+            openai.RateLimitError: If rate limited after all retries
+            openai.APIConnectionError: If connection fails
+        """
+        api_key = self.get_api_key()
+        if not api_key:
+            raise ValueError(
+                "OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
+            )
+
+        client = _get_client(api_key)
+
+        # Build messages list
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+
+        # Retry configuration
+        max_retries = 3
+        base_delay = 5  # Start with 5 seconds
+
+        for attempt in range(max_retries + 1):
+            # Once text has reached the caller a retry would duplicate
+            # it, so mid-stream failures are re-raised instead
+            yielded = False
+            try:
+                response = client.chat.completions.create(
+                    model=self.MODEL,
+                    max_tokens=max_tokens,
+                    messages=messages,
+                    stream=True,
+                )
+
+                for chunk in response:
+                    if not chunk.choices:
+                        continue
+                    content = chunk.choices[0].delta.content
+                    if content:
+                        yielded = True
+                        yield content
+                return
+
+            except openai.RateLimitError:
+                # If this was the last attempt, re-raise the error
+                if yielded or attempt >= max_retries:
+                    raise
+
+                # Calculate exponential backoff delay
+                delay = base_delay * (2**attempt)
+
+                # Wait before retrying
+                time.sleep(delay)
+
     def validate_api_key(self, api_key: Optional[str] = None) -> Tuple[bool, str]:
         """Validate an OpenAI API key by making a test request.
 
@@ -167,10 +247,7 @@ class OpenAIProvider(LLMProvider):
         Returns:
             Number of tokens
         """
-        if self._encoding is None:
-            # OpenAI uses cl100k_base encoding
-            self._encoding = tiktoken.get_encoding("cl100k_base")
-        return len(self._encoding.encode(text))
+        return len(get_encoding().encode(text))
 
     def get_api_key_env_var(self) -> str:
         """Get the environment variable name for OpenAI API key.
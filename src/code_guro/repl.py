@@ -3,25 +3,65 @@
 Provides a conversational interface for exploring code.
 """
 
+import string
+import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt
 
 from code_guro.frameworks import FrameworkInfo
-from code_guro.generator import create_output_dir
 from code_guro.prompts import INTERACTIVE_SYSTEM_PROMPT
 from code_guro.providers.factory import get_provider
 
 console = Console()
 
+# The interactive prompt template, parsed into (literal, field) segments
+# once at import so create_system_prompt splices values with a join
+# instead of re-parsing the template's braces on every call
+_SYSTEM_PROMPT_SEGMENTS = tuple(string.Formatter().parse(INTERACTIVE_SYSTEM_PROMPT))
+
 # Maximum conversation history to maintain
 MAX_HISTORY_PAIRS = 10
 
+# Q&A pairs of recent context included with each prompt
+CONTEXT_PAIRS = 3
+
+# Commands that end the session
+_EXIT_COMMANDS = frozenset({"exit", "quit", "q", ":q"})
+
+# Error-message markers checked in the loop's exception handler
+_RATE_LIMIT_MARKERS = ("rate limit", "quota")
+_CONNECTION_MARKERS = ("connection", "network")
+
+# Session-log markdown, one header plus one block per Q&A pair
+_SESSION_HEADER = """\
+# Interactive Session: {name}
+
+**Date:** {date}
+**Path:** `{path}`
+
+---
+"""
+
+_SESSION_ENTRY = """\
+## Question {number}
+
+> {question}
+
+### Answer
+
+{answer}
+
+---
+"""
+
 
 def create_system_prompt(path: Path, content: str, frameworks: List[FrameworkInfo]) -> str:
     """Create a system prompt for interactive mode.
@@ -38,46 +78,41 @@ def create_system_prompt(path: Path, content: str, frameworks: List[FrameworkInf
     if frameworks:
         framework_context = "Detected frameworks: " + ", ".join(f.name for f in frameworks)
 
-    return INTERACTIVE_SYSTEM_PROMPT.format(
-        path=str(path),
-        content=content[:50000],  # Limit content to avoid token limits
-        framework=framework_context or "No specific framework detected",
-    )
+    values = {
+        "path": str(path),
+        "content": content[:50000],  # Limit content to avoid token limits
+        "framework": framework_context or "No specific framework detected",
+    }
 
+    pieces = []
+    for literal, field, _format_spec, _conversion in _SYSTEM_PROMPT_SEGMENTS:
+        pieces.append(literal)
+        if field is not None:
+            pieces.append(values[field])
+    return "".join(pieces)
 
-def format_session_log(path: Path, history: List[Tuple[str, str]]) -> str:
+
+def format_session_log(path: Path, history: Iterable[Tuple[str, str]]) -> str:
     """Format conversation history as markdown.
 
     Args:
         path: Path being explained
-        history: List of (question, answer) tuples
+        history: (question, answer) tuples in conversation order
 
     Returns:
         Markdown formatted session log
     """
-    lines = [
-        f"# Interactive Session: {path.name}",
-        "",
-        f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        f"**Path:** `{path}`",
-        "",
-        "---",
-        "",
+    header = _SESSION_HEADER.format(
+        name=path.name,
+        date=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        path=path,
+    )
+    entries = [
+        _SESSION_ENTRY.format(number=i, question=question, answer=answer)
+        for i, (question, answer) in enumerate(history, 1)
     ]
-
-    for i, (question, answer) in enumerate(history, 1):
-        lines.append(f"## Question {i}")
-        lines.append("")
-        lines.append(f"> {question}")
-        lines.append("")
-        lines.append("### Answer")
-        lines.append("")
-        lines.append(answer)
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-    return "\n".join(lines)
+    # One format call and one join instead of ~10 list appends per entry
+    return "\n".join([header] + entries)
 
 
 def start_repl(
@@ -94,9 +129,12 @@ def start_repl(
     """
     provider = get_provider()
     system_prompt = create_system_prompt(path, content, frameworks)
-    conversation_history: List[Tuple[str, str]] = []
-    # Store conversation as simple prompt strings for provider abstraction
-    conversation_context = ""
+    # Bounded so pruning old pairs is automatic instead of a re-slice
+    conversation_history: deque = deque(maxlen=MAX_HISTORY_PAIRS)
+    # Recent context as simple "Q:"/"A:" lines for provider abstraction;
+    # the deque drops old lines itself, so each turn is two appends
+    # instead of re-slicing the history and re-joining the context
+    context_lines: deque = deque(maxlen=CONTEXT_PAIRS * 2)
 
     # Welcome message
     console.print()
@@ -121,67 +159,71 @@ def start_repl(
                 break
 
             # Check for exit commands
-            if question.lower().strip() in ("exit", "quit", "q"):
+            question = question.strip()
+            if question.lower() in _EXIT_COMMANDS:
                 break
 
-            if not question.strip():
+            if not question:
                 continue
 
             # Build prompt with conversation history
             # For simplicity, include recent conversation in the prompt
             # This works across all providers
             prompt_parts = []
-            if conversation_context:
+            if context_lines:
                 prompt_parts.append("Previous conversation:")
-                prompt_parts.append(conversation_context)
+                prompt_parts.extend(context_lines)
                 prompt_parts.append("")
             prompt_parts.append(f"User question: {question}")
 
             full_prompt = "\n".join(prompt_parts)
 
-            # Check if conversation is getting too long
+            # Check if conversation is getting too long; the deque's
+            # maxlen already keeps only the last N pairs
             if len(conversation_history) >= MAX_HISTORY_PAIRS:
                 console.print(
                     "[yellow]Note:[/yellow] Conversation is getting long. "
                     "Consider starting a fresh session for best results."
                 )
-                # Keep only the last N pairs
-                conversation_history = conversation_history[-MAX_HISTORY_PAIRS:]
-                # Rebuild context from remaining history
-                conversation_context = "\n".join(f"Q: {q}\nA: {a}" for q, a in conversation_history)
 
             # Call API
             console.print()
             console.print("[dim]Thinking...[/dim]")
 
             try:
-                answer = provider.call(
-                    prompt=full_prompt,
-                    system=system_prompt,
-                    max_tokens=2048,
-                )
+                # Stream the answer, re-rendering as chunks arrive, so
+                # text appears at first-token latency instead of after
+                # the full response has been generated
+                chunks: List[str] = []
+                console.print()
+                with Live(console=console, refresh_per_second=10) as live:
+                    for chunk in provider.call_stream(
+                        prompt=full_prompt,
+                        system=system_prompt,
+                        max_tokens=2048,
+                    ):
+                        chunks.append(chunk)
+                        live.update(Markdown("".join(chunks)))
+                answer = "".join(chunks)
 
                 # Add to conversation history
                 conversation_history.append((question, answer))
-                # Update context (keep last few exchanges)
-                recent_history = conversation_history[-3:]  # Last 3 Q&A pairs
-                conversation_context = "\n".join(f"Q: {q}\nA: {a}" for q, a in recent_history)
+                # Update context; the deque keeps only the last few pairs
+                context_lines.append(f"Q: {question}")
+                context_lines.append(f"A: {answer}")
 
-                # Display response with markdown formatting
-                console.print()
-                console.print(Markdown(answer))
                 console.print()
 
             except Exception as e:
                 from code_guro.errors import handle_api_error
 
                 error_msg = str(e).lower()
-                if "rate limit" in error_msg or "quota" in error_msg:
+                if any(marker in error_msg for marker in _RATE_LIMIT_MARKERS):
                     console.print(
                         "[yellow]Rate limit reached.[/yellow] "
                         "Please wait a moment before asking another question."
                     )
-                elif "connection" in error_msg or "network" in error_msg:
+                elif any(marker in error_msg for marker in _CONNECTION_MARKERS):
                     console.print(
                         "[red]Connection error.[/red] "
                         "Please check your internet connection and try again."
@@ -195,22 +237,35 @@ def start_repl(
     # Save session log
     if conversation_history:
         try:
-            # Find project root for output
-            parent = path.parent if path.is_file() else path
-            while parent != parent.parent:
-                if (parent / "package.json").exists() or (parent / "pyproject.toml").exists():
-                    break
-                parent = parent.parent
+            # Imported here so starting a session doesn't load the whole
+            # generation module just for this one helper
+            from code_guro.generator import create_output_dir
+
+            # Find project root for output; cached, so this reuses the
+            # walk the explain command already did for this tree
+            from code_guro.utils import find_project_root
+
+            parent = find_project_root(path.parent if path.is_file() else path)
 
             output_dir = create_output_dir(parent)
             session_log = format_session_log(path, conversation_history)
 
             filename = f"explain-{path.name.replace('/', '-')}-session.md"
             filepath = output_dir / filename
-            filepath.write_text(session_log)
+
+            # Write on a background thread so exit isn't blocked on
+            # disk I/O; the non-daemon thread is joined at interpreter
+            # shutdown, so the log still lands before the process ends
+            def _write_log():
+                try:
+                    filepath.write_text(session_log)
+                except OSError as e:
+                    console.print(f"[yellow]Could not save session:[/yellow] {str(e)}")
+
+            threading.Thread(target=_write_log, name="session-log-writer").start()
 
             console.print()
-            console.print(f"[dim]Session saved to: {filepath}[/dim]")
+            console.print(f"[dim]Saving session to: {filepath}[/dim]")
 
         except Exception as e:
             console.print(f"[yellow]Could not save session:[/yellow] {str(e)}")
@@ -4,13 +4,12 @@ Includes file handling, token counting, and cost estimation.
 """
 
 import fnmatch
+import functools
 import os
 import re
 from pathlib import Path
 from typing import Generator, Optional, Set
 
-import tiktoken
-
 # Binary file extensions to skip
 BINARY_EXTENSIONS = {
     # Images
@@ -108,12 +107,20 @@ MAX_CONTEXT_TOKENS = 200000  # Maximum context window
 SAFE_CONTEXT_TOKENS = 150000  # Leave room for response
 
 
+@functools.lru_cache(maxsize=1)
 def get_encoding():
     """Get the tiktoken encoding for token counting.
 
     Uses cl100k_base encoding which works for Anthropic Claude and OpenAI models.
     For Google Gemini, this is an approximation.
+
+    Cached: building the encoding loads the BPE ranks from disk, and
+    every provider shares this one instance. The import lives here too,
+    so commands that never count tokens (configure, convert) don't pay
+    for loading tiktoken's extension module at startup.
     """
+    import tiktoken
+
     return tiktoken.get_encoding("cl100k_base")
 
 
@@ -140,6 +147,33 @@ def count_tokens(text: str) -> int:
         return len(encoding.encode(text))
 
 
+def count_tokens_batch(texts) -> list:
+    """Count tokens for many text strings using the configured provider's tokenizer.
+
+    Much faster than calling count_tokens in a loop: tiktoken's
+    encode_batch parallelizes the encoding across threads.
+
+    Args:
+        texts: List of text strings to count tokens for
+
+    Returns:
+        List with the token count for each text, in input order
+
+    Note:
+        Falls back to tiktoken if provider is not configured (for backwards compatibility).
+    """
+    try:
+        from code_guro.providers.factory import get_provider
+
+        provider = get_provider()
+        return provider.count_tokens_batch(texts)
+    except (ValueError, Exception):
+        # Fallback to tiktoken for backwards compatibility
+        encoding = get_encoding()
+        num_threads = os.cpu_count() or 4
+        return [len(tokens) for tokens in encoding.encode_batch(texts, num_threads=num_threads)]
+
+
 def estimate_cost(input_tokens: int, output_tokens: int = 0) -> float:
     """Estimate API cost based on token counts using the configured provider.
 
@@ -319,6 +353,35 @@ def read_file_safely(path: Path) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=64)
+def find_project_root(start: Path) -> Path:
+    """Walk upward from start looking for a package.json/pyproject.toml.
+
+    One listdir per ancestor replaces two per-ancestor stat probes, and
+    results are cached since callers tend to ask about the same tree
+    repeatedly. The search stops at the filesystem root, which is
+    returned if no marker is found.
+
+    Args:
+        start: Directory to start the search from
+
+    Returns:
+        The nearest ancestor (including start) containing a marker file
+    """
+    cur = start
+    while True:
+        parent = cur.parent
+        if parent == cur:
+            return cur
+        try:
+            names = os.listdir(cur)
+        except OSError:
+            names = ()
+        if "package.json" in names or "pyproject.toml" in names:
+            return cur
+        cur = parent
+
+
 def traverse_directory(
     root: Path,
     respect_gitignore: bool = True,